@@ -7,7 +7,7 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 
 # 导入模型和配置
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.database import Base
 from app.models import *  # noqa: F401, F403
 
@@ -21,9 +21,6 @@ if config.config_file_name is not None:
 # 元数据（用于 autogenerate）
 target_metadata = Base.metadata
 
-# 从应用配置获取数据库 URL
-settings = get_settings()
-
 
 def get_url():
     """获取同步数据库 URL"""
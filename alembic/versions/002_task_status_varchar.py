@@ -0,0 +1,71 @@
+"""Store task status/priority as VARCHAR with CHECK constraints
+
+Revision ID: 002_task_status_varchar
+Revises: 001_initial
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002_task_status_varchar'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_VALUES = ('pending', 'in_progress', 'completed', 'archived')
+PRIORITY_VALUES = ('low', 'medium', 'high', 'urgent')
+
+
+def _in_list(column: str, values: Sequence[str]) -> str:
+    return "{} IN ({})".format(column, ", ".join(f"'{v}'" for v in values))
+
+
+def upgrade() -> None:
+    # The ENUM columns become plain VARCHAR(20); allowed values are enforced
+    # by CHECK constraints (MySQL 8.0.16+), so adding a value no longer
+    # requires rewriting the column type.
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.alter_column(
+            'status',
+            existing_type=sa.Enum(*STATUS_VALUES, name='taskstatus'),
+            type_=sa.String(20),
+            existing_nullable=False,
+            existing_comment='任务状态',
+        )
+        batch_op.alter_column(
+            'priority',
+            existing_type=sa.Enum(*PRIORITY_VALUES, name='taskpriority'),
+            type_=sa.String(20),
+            existing_nullable=False,
+            existing_comment='优先级',
+        )
+        batch_op.create_check_constraint(
+            'ck_tasks_status', _in_list('status', STATUS_VALUES)
+        )
+        batch_op.create_check_constraint(
+            'ck_tasks_priority', _in_list('priority', PRIORITY_VALUES)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_constraint('ck_tasks_priority', type_='check')
+        batch_op.drop_constraint('ck_tasks_status', type_='check')
+        batch_op.alter_column(
+            'priority',
+            existing_type=sa.String(20),
+            type_=sa.Enum(*PRIORITY_VALUES, name='taskpriority'),
+            existing_nullable=False,
+            existing_comment='优先级',
+        )
+        batch_op.alter_column(
+            'status',
+            existing_type=sa.String(20),
+            type_=sa.Enum(*STATUS_VALUES, name='taskstatus'),
+            existing_nullable=False,
+            existing_comment='任务状态',
+        )
@@ -0,0 +1,44 @@
+"""Add one created_at index per task list filter combination
+
+Revision ID: 003_task_list_indexes
+Revises: 002_task_status_varchar
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_task_list_indexes'
+down_revision: Union[str, None] = '002_task_status_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The task list filters on user_id plus an optional status or category
+    # and orders by created_at DESC, so each filter combination gets its own
+    # equality prefix followed by created_at and none of them needs a filesort.
+    op.create_index(
+        'ix_tasks_user_created',
+        'tasks',
+        ['user_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_tasks_user_status_created',
+        'tasks',
+        ['user_id', 'status', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_tasks_user_cat_created',
+        'tasks',
+        ['user_id', 'category_id', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_user_cat_created', table_name='tasks')
+    op.drop_index('ix_tasks_user_status_created', table_name='tasks')
+    op.drop_index('ix_tasks_user_created', table_name='tasks')
@@ -0,0 +1,46 @@
+"""Replace single-column indexes with user-scoped composite keys
+
+Revision ID: 004_index_cleanup
+Revises: 003_task_list_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_index_cleanup'
+down_revision: Union[str, None] = '003_task_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_id lookups on categories/tags (and their user_id foreign keys)
+    # are served by the leading column of the (user_id, name) unique keys.
+    op.drop_index('ix_categories_user_id', table_name='categories')
+    op.drop_index('ix_tags_user_id', table_name='tags')
+
+    # Due date lookups are always user-scoped (upcoming / overdue tasks).
+    op.create_index('ix_tasks_user_due', 'tasks', ['user_id', 'due_date'])
+    op.drop_index('ix_tasks_due_date', table_name='tasks')
+
+    # user_id lookups on tasks are served by the (user_id, ...) indexes from
+    # 003, and status is never filtered without user_id.
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+    op.drop_index('ix_tasks_status', table_name='tasks')
+
+    # The task_tags PK leads with task_id; reverse lookups by tag (and the
+    # tag_id foreign key) need their own index.
+    op.create_index('ix_task_tags_tag_id', 'task_tags', ['tag_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_tags_tag_id', table_name='task_tags')
+    op.create_index('ix_tasks_status', 'tasks', ['status'])
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'])
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date'])
+    op.drop_index('ix_tasks_user_due', table_name='tasks')
+    op.create_index('ix_tags_user_id', 'tags', ['user_id'])
+    op.create_index('ix_categories_user_id', 'categories', ['user_id'])
@@ -0,0 +1,61 @@
+"""Let the database stamp created_at / updated_at
+
+Revision ID: 005_timestamp_server_defaults
+Revises: 004_index_cleanup
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_timestamp_server_defaults'
+down_revision: Union[str, None] = '004_index_cleanup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('users', 'categories', 'tags', 'tasks')
+
+
+def upgrade() -> None:
+    # The ORM no longer sends Python-side timestamps: inserts rely on the
+    # column default and updates set updated_at = CURRENT_TIMESTAMP.
+    # On MySQL updated_at also gets ON UPDATE so raw SQL updates stay correct.
+    is_mysql = op.get_bind().dialect.name == 'mysql'
+    updated_default = sa.text(
+        'CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'
+        if is_mysql else 'CURRENT_TIMESTAMP'
+    )
+    for table in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at',
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.text('CURRENT_TIMESTAMP'),
+            )
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=updated_default,
+            )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at',
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
@@ -2,10 +2,14 @@
 API 依赖注入模块
 提供认证和服务注入
 """
+import time
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_user, get_cached_user, token_cache
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User
@@ -17,11 +21,49 @@ from app.services.task_service import TaskService
 from app.services.user_service import UserService
 
 # HTTP Bearer 认证方案
-security = HTTPBearer()
+# 关闭 auto_error，缺失凭证时由 get_current_user 统一返回 401
+security = HTTPBearer(auto_error=False)
+
+
+def _get_token_user_id(token: str) -> Optional[int]:
+    """
+    从 Token 中解析用户 ID（带缓存）
+
+    Args:
+        token: JWT 令牌字符串
+
+    Returns:
+        用户 ID，Token 无效或已过期返回 None
+    """
+    cached = token_cache.get(token)
+    if cached is not None:
+        user_id, exp = cached
+        if exp > time.time():
+            return user_id
+        token_cache.pop(token, None)
+        return None
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        return None
+
+    try:
+        user_id = int(user_id_str)
+    except (TypeError, ValueError):
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache[token] = (user_id, exp)
+    return user_id
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -45,27 +87,29 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # 解码 Token
-    payload = decode_access_token(credentials.credentials)
-    if payload is None:
+    if credentials is None:
         raise credentials_exception
 
-    # 获取用户 ID
-    user_id_str: str = payload.get("sub")
-    if user_id_str is None:
+    # 格式明显不是 JWT（header.payload.signature）时直接拒绝，不做解码
+    token = credentials.credentials
+    if token.count(".") != 2:
         raise credentials_exception
 
-    try:
-        user_id = int(user_id_str)
-    except ValueError:
+    # 解码 Token 获取用户 ID
+    user_id = _get_token_user_id(token)
+    if user_id is None:
         raise credentials_exception
 
-    # 查询用户
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(user_id)
-
+    # 查询用户（优先使用缓存快照）
+    user = get_cached_user(user_id)
     if user is None:
-        raise credentials_exception
+        user_repo = UserRepository(db)
+        snapshot = await user_repo.get_auth_snapshot(user_id)
+
+        if snapshot is None:
+            raise credentials_exception
+
+        user = cache_user(snapshot)
 
     if not user.is_active:
         raise HTTPException(
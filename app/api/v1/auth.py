@@ -29,8 +29,7 @@ async def register(
     - **email**: 有效邮箱地址
     - **password**: 密码（至少6个字符）
     """
-    user = await auth_service.register(user_in)
-    return UserResponse.model_validate(user)
+    return await auth_service.register(user_in)
 
 
 @router.post(
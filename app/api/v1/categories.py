@@ -32,8 +32,7 @@ async def create_category(
     - **description**: 分类描述
     - **color**: 显示颜色（HEX格式，如 #3B82F6）
     """
-    category = await category_service.create_category(current_user.id, category_in)
-    return CategoryResponse.model_validate(category)
+    return await category_service.create_category(current_user.id, category_in)
 
 
 @router.get(
@@ -46,8 +45,7 @@ async def get_categories(
     category_service: CategoryService = Depends(get_category_service),
 ):
     """获取当前用户的所有分类"""
-    categories = await category_service.get_user_categories(current_user.id)
-    return [CategoryResponse.model_validate(c) for c in categories]
+    return await category_service.get_user_categories(current_user.id)
 
 
 @router.get(
@@ -61,8 +59,7 @@ async def get_category(
     category_service: CategoryService = Depends(get_category_service),
 ):
     """获取指定分类的详细信息"""
-    category = await category_service.get_category(category_id, current_user.id)
-    return CategoryResponse.model_validate(category)
+    return await category_service.get_category(category_id, current_user.id)
 
 
 @router.put(
@@ -77,10 +74,9 @@ async def update_category(
     category_service: CategoryService = Depends(get_category_service),
 ):
     """更新分类信息"""
-    category = await category_service.update_category(
+    return await category_service.update_category(
         category_id, current_user.id, category_in
     )
-    return CategoryResponse.model_validate(category)
 
 
 @router.delete(
@@ -31,8 +31,7 @@ async def create_tag(
     - **name**: 标签名称（必填）
     - **color**: 显示颜色（HEX格式，如 #10B981）
     """
-    tag = await tag_service.create_tag(current_user.id, tag_in)
-    return TagResponse.model_validate(tag)
+    return await tag_service.create_tag(current_user.id, tag_in)
 
 
 @router.get(
@@ -45,8 +44,7 @@ async def get_tags(
     tag_service: TagService = Depends(get_tag_service),
 ):
     """获取当前用户的所有标签"""
-    tags = await tag_service.get_user_tags(current_user.id)
-    return [TagResponse.model_validate(t) for t in tags]
+    return await tag_service.get_user_tags(current_user.id)
 
 
 @router.get(
@@ -60,8 +58,7 @@ async def get_tag(
     tag_service: TagService = Depends(get_tag_service),
 ):
     """获取指定标签的详细信息"""
-    tag = await tag_service.get_tag(tag_id, current_user.id)
-    return TagResponse.model_validate(tag)
+    return await tag_service.get_tag(tag_id, current_user.id)
 
 
 @router.put(
@@ -76,8 +73,7 @@ async def update_tag(
     tag_service: TagService = Depends(get_tag_service),
 ):
     """更新标签信息"""
-    tag = await tag_service.update_tag(tag_id, current_user.id, tag_in)
-    return TagResponse.model_validate(tag)
+    return await tag_service.update_tag(tag_id, current_user.id, tag_in)
 
 
 @router.delete(
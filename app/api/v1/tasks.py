@@ -14,6 +14,7 @@ from app.schemas.task import (
     TaskCreate,
     TaskListResponse,
     TaskResponse,
+    TaskStatistics,
     TaskUpdate,
 )
 from app.services.task_service import TaskService
@@ -44,8 +45,7 @@ async def create_task(
     - **category_id**: 分类 ID
     - **tag_ids**: 标签 ID 列表
     """
-    task = await task_service.create_task(current_user.id, task_in)
-    return TaskResponse.model_validate(task)
+    return await task_service.create_task(current_user.id, task_in)
 
 
 @router.get(
@@ -59,13 +59,17 @@ async def get_tasks(
     category_id: Optional[int] = Query(None, description="按分类筛选"),
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    cursor: Optional[str] = Query(
+        None, description="分页游标（上一页返回的 next_cursor），传入时忽略 page"
+    ),
     current_user: User = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
     """
     获取任务列表
 
-    支持按状态和分类筛选，返回分页结果
+    支持按状态和分类筛选，返回分页结果。
+    深分页建议使用 cursor：每页耗时与页码无关
     """
     return await task_service.get_user_tasks(
         user_id=current_user.id,
@@ -73,11 +77,13 @@ async def get_tasks(
         category_id=category_id,
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
 
 
 @router.get(
     "/statistics",
+    response_model=TaskStatistics,
     summary="获取任务统计",
     description="获取当前用户的任务统计信息",
 )
@@ -104,8 +110,7 @@ async def get_task(
     task_service: TaskService = Depends(get_task_service),
 ):
     """获取指定任务的详细信息"""
-    task = await task_service.get_task(task_id, current_user.id)
-    return TaskResponse.model_validate(task)
+    return await task_service.get_task(task_id, current_user.id)
 
 
 @router.put(
@@ -124,8 +129,7 @@ async def update_task(
 
     所有字段都是可选的，只更新提供的字段
     """
-    task = await task_service.update_task(task_id, current_user.id, task_in)
-    return TaskResponse.model_validate(task)
+    return await task_service.update_task(task_id, current_user.id, task_in)
 
 
 @router.patch(
@@ -144,8 +148,7 @@ async def change_task_status(
 
     用于任务状态流转，如标记完成
     """
-    task = await task_service.change_status(task_id, current_user.id, new_status)
-    return TaskResponse.model_validate(task)
+    return await task_service.change_status(task_id, current_user.id, new_status)
 
 
 @router.delete(
@@ -20,7 +20,7 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user),
 ):
     """获取当前登录用户的详细信息"""
-    return UserResponse.model_validate(current_user)
+    return current_user
 
 
 @router.put(
@@ -38,5 +38,4 @@ async def update_current_user(
 
     所有字段都是可选的，只更新提供的字段
     """
-    user = await user_service.update_user(current_user.id, user_in)
-    return UserResponse.model_validate(user)
+    return await user_service.update_user(current_user.id, user_in)
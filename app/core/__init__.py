@@ -1,3 +1,3 @@
-from app.core.config import get_settings, Settings
+from app.core.config import Settings, settings
 
-__all__ = ["get_settings", "Settings"]
+__all__ = ["Settings", "settings"]
@@ -0,0 +1,99 @@
+"""
+缓存模块
+进程内 TTL 缓存，减少认证路径上重复的 JWT 解码和用户查询
+"""
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+# Token 解码缓存：token -> (user_id, exp)
+# 命中时跳过 JWT 签名校验和 payload 解析，过期时间仍以 token 自身的 exp 为准
+token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# 用户快照缓存：user_id -> 用户基本字段
+# TTL 较短，资料变更/停用后最多延迟 30 秒在其他 worker 进程生效
+user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    从缓存获取用户快照
+
+    Args:
+        user_id: 用户 ID
+
+    Returns:
+        未绑定会话的用户对象，未命中返回 None
+    """
+    snapshot: Optional[Dict[str, Any]] = user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return User(**snapshot)
+
+
+def cache_user(snapshot: Dict[str, Any]) -> User:
+    """
+    写入用户快照缓存
+
+    Args:
+        snapshot: 用户基本字段（见 UserRepository.get_auth_snapshot）
+
+    Returns:
+        由快照构建的未绑定会话的用户对象
+    """
+    user_cache[snapshot["id"]] = snapshot
+    return User(**snapshot)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    使用户快照缓存失效
+
+    用户资料更新或停用后调用
+
+    Args:
+        user_id: 用户 ID
+    """
+    user_cache.pop(user_id, None)
+
+
+# 会话 info 中待提交后失效的用户 ID 集合
+_PENDING_USER_INVALIDATIONS = "pending_user_invalidations"
+
+
+def invalidate_user_after_commit(session: AsyncSession, user_id: int) -> None:
+    """
+    在会话提交后使用户快照缓存失效
+
+    提交前失效时，并发请求可能在提交前读到旧数据并重新写入缓存，
+    旧快照（如 is_active=True）会保留整个 TTL，因此推迟到提交之后
+
+    Args:
+        session: 执行更新的数据库会话
+        user_id: 用户 ID
+    """
+    session.info.setdefault(_PENDING_USER_INVALIDATIONS, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """提交成功后失效本次事务更新过的用户快照"""
+    for user_id in session.info.pop(_PENDING_USER_INVALIDATIONS, ()):
+        user_cache.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction: Any) -> None:
+    """回滚后数据未变化，丢弃待失效的用户 ID"""
+    session.info.pop(_PENDING_USER_INVALIDATIONS, None)
+
+
+def clear_caches() -> None:
+    """清空所有缓存"""
+    token_cache.clear()
+    user_cache.clear()
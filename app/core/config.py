@@ -2,7 +2,6 @@
 应用配置模块
 使用 Pydantic Settings 管理环境变量，体现配置集中化和类型安全
 """
-from functools import lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +27,10 @@ class Settings(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: int = 123456
     DB_NAME: str = "task_management"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # 慢查询阈值（毫秒），DEBUG 模式下超过该耗时的 SELECT 会记录执行计划
+    SLOW_QUERY_THRESHOLD_MS: int = 50
 
     @property
     def ASYNC_DATABASE_URL(self) -> str:
@@ -57,6 +60,10 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 非对称签名（如 ALGORITHM=EdDSA）时使用的 PEM 密钥，未设置则使用 SECRET_KEY
+    # 公钥可分发给网关等边缘服务独立验证 Token，未设置时从私钥推导
+    JWT_PRIVATE_KEY_PEM: Optional[str] = None
+    JWT_PUBLIC_KEY_PEM: Optional[str] = None
 
     # 日志配置
     LOG_LEVEL: str = "INFO"
@@ -69,11 +76,5 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """
-    获取配置单例
-
-    使用 lru_cache 确保配置只加载一次，提升性能
-    """
-    return Settings()
+# 全局配置单例，模块导入时加载一次
+settings = Settings()
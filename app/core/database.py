@@ -2,28 +2,46 @@
 数据库连接模块
 实现异步数据库会话管理和连接池配置
 """
-from typing import AsyncGenerator
+import asyncio
+import json
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
-from app.core.config import get_settings
-
-settings = get_settings()
+from app.core.config import settings
 
 # 创建异步数据库引擎
 # SQLite 不支持连接池参数
-_engine_kwargs = {
+_engine_kwargs: Dict[str, Any] = {
     "echo": settings.DEBUG,
+    # 编译语句缓存容量（默认 500），容纳各 Repository 的全部查询形态
+    "query_cache_size": 1200,
 }
 
+_is_sqlite = settings.ASYNC_DATABASE_URL.startswith("sqlite")
+
 # MySQL 特定参数
-if not settings.ASYNC_DATABASE_URL.startswith("sqlite"):
+if not _is_sqlite:
     _engine_kwargs.update({
         "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
         "pool_recycle": 3600,
+        # LIFO 复用最近归还的连接，保持热连接，空闲连接自然老化回收
+        "pool_use_lifo": True,
+        # 时间戳由数据库生成，会话时区固定为 UTC
+        "connect_args": {"init_command": "SET time_zone = '+00:00'"},
     })
 
 engine = create_async_engine(settings.ASYNC_DATABASE_URL, **_engine_kwargs)
@@ -38,21 +56,129 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# 当前请求的接口标识（如 "GET /api/v1/tasks"），用于慢查询日志定位来源
+query_endpoint: ContextVar[str] = ContextVar("query_endpoint", default="-")
+
+# 各方言的执行计划语法
+_EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "mysql": "EXPLAIN FORMAT=TREE ",
+}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """记录语句开始执行时间"""
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    慢查询检测
+
+    SELECT 耗时超过阈值时，在同一连接上另开游标执行 EXPLAIN，
+    以 JSON 记录接口、耗时、SQL 和执行计划
+    """
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    if elapsed_ms < settings.SLOW_QUERY_THRESHOLD_MS or executemany:
+        return
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return
+
+    try:
+        # 原始 DBAPI 游标不触发 SQLAlchemy 事件，不会递归
+        explain_cursor = conn.connection.cursor()
+        try:
+            prefix = _EXPLAIN_PREFIXES.get(conn.dialect.name, "EXPLAIN ")
+            explain_cursor.execute(prefix + statement, parameters)
+            plan = [list(row) for row in explain_cursor.fetchall()]
+        finally:
+            explain_cursor.close()
+    except Exception as exc:
+        plan = f"EXPLAIN failed: {exc}"
+
+    logger.warning(
+        "Slow query: {}",
+        json.dumps(
+            {
+                "endpoint": query_endpoint.get(),
+                "elapsed_ms": round(elapsed_ms, 2),
+                "statement": statement,
+                "plan": plan,
+            },
+            ensure_ascii=False,
+            default=str,
+        ),
+    )
+
+
+def enable_query_profiling(target_engine: AsyncEngine) -> None:
+    """
+    为引擎注册慢查询检测事件
+
+    Args:
+        target_engine: 异步数据库引擎
+    """
+    sync_engine = target_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# 仅在 DEBUG 模式下启用，生产环境没有额外开销
+if settings.DEBUG:
+    enable_query_profiling(engine)
+
+
+async def warmup_pool() -> None:
+    """
+    预热数据库连接池
+
+    启动时并发建立 pool_size 个连接并归还到池中，
+    避免首批请求承担 TCP 握手和认证的延迟
+    """
+    if _is_sqlite:
+        return
+
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DB_POOL_SIZE)),
+        return_exceptions=True,
+    )
+    # 先归还所有建立成功的连接，再抛出首个失败，避免部分失败时泄漏连接
+    error: Optional[BaseException] = None
+    for result in results:
+        if isinstance(result, BaseException):
+            error = error or result
+        else:
+            await result.close()
+    if error is not None:
+        raise error
+
+
 class Base(DeclarativeBase):
     """ORM 模型基类"""
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# 只读 HTTP 方法，请求结束时无需提交事务
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     获取数据库会话的依赖注入函数
 
-    使用 async with 确保会话正确关闭，异常时自动回滚
+    写请求成功后提交事务；只读请求不提交，由 close 回滚并归还连接，
+    省去一次 COMMIT 往返。异常时自动回滚
     """
+    if settings.DEBUG:
+        route = request.scope.get("route")
+        path = getattr(route, "path", request.url.path)
+        query_endpoint.set(f"{request.method} {path}")
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if request.method not in _SAFE_METHODS:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
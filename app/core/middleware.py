@@ -0,0 +1,140 @@
+"""
+ASGI 中间件模块
+纯 ASGI 实现，不构造 Request/Response 对象，降低每个请求的中间件开销
+"""
+from typing import List, Optional, Tuple
+
+import orjson
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import AppException
+
+Headers = List[Tuple[bytes, bytes]]
+
+# 允许的全部 HTTP 方法（与 allow_methods=["*"] 等价）
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class AllowAllCORSMiddleware:
+    """
+    允许所有来源的 CORS 中间件
+
+    等价于 allow_origins=["*"]、allow_credentials=True、
+    allow_methods=["*"]、allow_headers=["*"] 的 CORSMiddleware 配置。
+    由于允许携带凭证，浏览器不接受 "*"，因此回显请求的 Origin
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 600):
+        self.app = app
+        # 固定响应头在初始化时构建一次
+        self.simple_headers: Headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self.preflight_headers: Headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-allow-methods", _ALLOW_METHODS),
+            (b"access-control-max-age", str(max_age).encode("ascii")),
+            (b"vary", b"Origin"),
+            (b"content-length", b"2"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # 非跨域请求直接放行
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 预检请求由中间件直接响应，不进入应用
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin)]
+            headers.extend(self.preflight_headers)
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": headers,
+            })
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        simple_headers = [(b"access-control-allow-origin", origin)]
+        simple_headers.extend(self.simple_headers)
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + simple_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class AppExceptionMiddleware:
+    """
+    全局异常处理中间件
+
+    在 ASGI 层捕获业务异常和未处理异常，直接输出 JSON 错误响应，
+    不为错误路径构造 Request/JSONResponse 对象
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except AppException as exc:
+            # 响应已开始发送时无法再改写状态码，交给服务器处理
+            if response_started:
+                raise
+            logger.warning("App exception: {}", exc.message)
+            await self._send_error(send, exc.status_code, exc.message)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.opt(exception=exc).error("Unhandled exception: {}", exc)
+            await self._send_error(send, 500, "Internal server error")
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, message: str) -> None:
+        """发送 {"detail": message} 格式的 JSON 错误响应"""
+        body = orjson.dumps({"detail": message})
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
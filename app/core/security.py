@@ -2,18 +2,69 @@
 安全模块
 处理 JWT 令牌生成/验证和密码加密
 """
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import anyio
+import bcrypt
+import jwt
 
-from app.core.config import get_settings
+from app.core.config import settings
 
-settings = get_settings()
+# bcrypt 计算成本（2^12 轮）
+BCRYPT_ROUNDS = 12
 
-# 密码加密上下文，使用 bcrypt 算法
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _load_jwt_keys() -> Tuple[Any, Any]:
+    """
+    加载 JWT 签名密钥和验证密钥
+
+    配置了 JWT_PRIVATE_KEY_PEM 时使用非对称密钥（如 Ed25519），
+    PEM 在此解析一次，避免每次签发/验证时重复解析；否则使用 SECRET_KEY
+
+    Returns:
+        (签名密钥, 验证密钥)
+
+    Raises:
+        ValueError: ALGORITHM 与密钥类型不匹配（HS* 配置了 PEM，或非对称算法未配置 PEM）
+    """
+    # 启动时校验算法与密钥类型，避免配置错误时每次签发令牌都失败
+    is_symmetric = settings.ALGORITHM.upper().startswith("HS")
+    if is_symmetric and settings.JWT_PRIVATE_KEY_PEM:
+        raise ValueError(
+            f"ALGORITHM={settings.ALGORITHM} uses SECRET_KEY, "
+            "unset JWT_PRIVATE_KEY_PEM or choose an asymmetric algorithm"
+        )
+    if not is_symmetric and not settings.JWT_PRIVATE_KEY_PEM:
+        raise ValueError(
+            f"ALGORITHM={settings.ALGORITHM} requires JWT_PRIVATE_KEY_PEM"
+        )
+
+    if not settings.JWT_PRIVATE_KEY_PEM:
+        secret = settings.SECRET_KEY.encode("utf-8")
+        return secret, secret
+
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+
+    private_key = load_pem_private_key(
+        settings.JWT_PRIVATE_KEY_PEM.encode("utf-8"), password=None
+    )
+    if settings.JWT_PUBLIC_KEY_PEM:
+        public_key = load_pem_public_key(settings.JWT_PUBLIC_KEY_PEM.encode("utf-8"))
+    else:
+        public_key = private_key.public_key()
+    return private_key, public_key
+
+
+# JWT 密钥与算法，导入时确定，避免每次编解码重复读取配置
+_JWT_SIGNING_KEY, _JWT_VERIFYING_KEY = _load_jwt_keys()
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,7 +78,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         密码是否匹配
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        # 哈希格式无效
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -40,7 +98,69 @@ def get_password_hash(password: str) -> str:
     Returns:
         哈希后的密码字符串
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"),
+        bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
+    ).decode("utf-8")
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    异步验证密码
+
+    bcrypt 计算约 100ms 且会释放 GIL，放到线程池执行，
+    既不阻塞事件循环，又能利用多核并行
+
+    Args:
+        plain_password: 用户输入的明文密码
+        hashed_password: 数据库存储的哈希密码
+
+    Returns:
+        密码是否匹配
+    """
+    return await anyio.to_thread.run_sync(
+        verify_password, plain_password, hashed_password
+    )
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """随机密码的占位哈希，进程内只计算一次"""
+    return get_password_hash(secrets.token_urlsafe(16))
+
+
+def _verify_dummy_password(plain_password: str) -> bool:
+    """与占位哈希比对，耗时与真实校验相同，结果恒为 False"""
+    verify_password(plain_password, _dummy_password_hash())
+    return False
+
+
+async def verify_dummy_password_async(plain_password: str) -> bool:
+    """
+    异步执行一次占位密码校验
+
+    用户不存在时调用，使响应耗时与密码错误时一致，避免通过耗时枚举邮箱
+
+    Args:
+        plain_password: 用户输入的明文密码
+
+    Returns:
+        始终为 False
+    """
+    return await anyio.to_thread.run_sync(_verify_dummy_password, plain_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    异步生成密码哈希（在线程池中执行 bcrypt）
+
+    Args:
+        password: 明文密码
+
+    Returns:
+        哈希后的密码字符串
+    """
+    return await anyio.to_thread.run_sync(get_password_hash, password)
 
 
 def create_access_token(
@@ -68,12 +188,7 @@ def create_access_token(
 
     to_encode.update({"exp": expire})
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
-    )
-    return encoded_jwt
+    return jwt.encode(to_encode, _JWT_SIGNING_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
@@ -87,11 +202,11 @@ def decode_access_token(token: str) -> Optional[dict]:
         解码后的 payload，验证失败返回 None
     """
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+            _JWT_VERIFYING_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            options={"verify_aud": False},
         )
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
@@ -0,0 +1,72 @@
+"""
+静态文件模块
+在 StaticFiles 基础上附加浏览器缓存策略，并为资源 URL 生成内容指纹
+"""
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Dict
+
+from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
+
+# 文件名中带内容哈希（如 main.3f9a2c1d.js）的资源内容不会变化，可长期缓存
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[^./]+$")
+
+# 带 ?v=<内容哈希> 指纹的 URL 同样视为不可变
+_VERSION_QUERY = re.compile(rb"(?:^|&)v=[0-9a-f]{8,}(?:&|$)")
+
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=604800, immutable"
+_DEFAULT_CACHE_CONTROL = "public, max-age=60"
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    带缓存头的静态文件服务
+
+    带内容指纹（哈希文件名或 ?v= 参数）的资源长期缓存；其余资源短期缓存，
+    过期后通过 ETag/Last-Modified 协商，未修改时返回 304
+    """
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _HASHED_NAME.search(os.fspath(full_path)) or _VERSION_QUERY.search(
+            scope.get("query_string", b"")
+        ):
+            response.headers["cache-control"] = _IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["cache-control"] = _DEFAULT_CACHE_CONTROL
+        return response
+
+
+def build_static_urls(directory: Path, prefix: str = "/static") -> Dict[str, str]:
+    """
+    为目录下的全部静态文件生成带内容指纹的 URL
+
+    文件内容变化时指纹随之变化，浏览器会请求新 URL，因此旧 URL 可以长期缓存
+
+    Args:
+        directory: 静态文件目录
+        prefix: 静态文件挂载路径
+
+    Returns:
+        相对路径（如 css/style.css）到指纹 URL 的映射
+    """
+    urls: Dict[str, str] = {}
+    if not directory.is_dir():
+        return urls
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(directory).as_posix()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+        urls[relative] = f"{prefix}/{relative}?v={digest}"
+    return urls
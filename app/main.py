@@ -4,22 +4,28 @@ FastAPI 应用创建和配置
 """
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Tuple
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 from app.api.v1.router import api_router
-from app.core.config import get_settings
-from app.core.exceptions import AppException
+from app.core.config import settings
+from app.core.database import engine, warmup_pool
+from app.core.middleware import AllowAllCORSMiddleware, AppExceptionMiddleware
+from app.core.staticfiles import CachedStaticFiles, build_static_urls
+from app.schemas.common import HealthResponse
 from app.utils.logger import setup_logging
 
 # 初始化配置和日志
-settings = get_settings()
 logger = setup_logging()
 
+# 应用目录路径，导入时解析一次
+_APP_DIR = Path(__file__).resolve().parent
+_STATIC_DIR = _APP_DIR / "static"
+_TEMPLATES_DIR = _APP_DIR / "templates"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,9 +37,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    try:
+        await warmup_pool()
+    except Exception as e:
+        logger.warning(f"Database pool warmup failed: {e}")
+
     yield
 
     logger.info("Shutting down application...")
+    await engine.dispose()
 
 
 # 创建 FastAPI 应用
@@ -57,8 +69,10 @@ app = FastAPI(
 - MySQL + Alembic
 - Pydantic + JWT
 """,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # 生产环境不暴露接口文档，也不生成 OpenAPI schema
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
     openapi_tags=[
         {"name": "Authentication", "description": "用户认证相关接口"},
         {"name": "Users", "description": "用户信息管理"},
@@ -70,51 +84,58 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS 中间件
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 生产环境应限制域名
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# 静态文件
-static_path = Path(__file__).parent / "static"
-if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+# 全局异常处理（位于 CORS 内层，错误响应同样附加 CORS 响应头）
+app.add_middleware(AppExceptionMiddleware)
 
-# 模板引擎
-templates_path = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=str(templates_path))
+# CORS 中间件（允许所有来源，生产环境应限制域名）
+app.add_middleware(AllowAllCORSMiddleware)
 
-# 注册 API 路由
-app.include_router(api_router, prefix="/api/v1")
+# 静态文件（附加缓存头，协商缓存命中时返回 304）
+if _STATIC_DIR.is_dir():
+    app.mount(
+        "/static",
+        CachedStaticFiles(directory=_STATIC_DIR, follow_symlink=False),
+        name="static",
+    )
 
+# 模板引擎
+templates = Jinja2Templates(directory=_TEMPLATES_DIR)
+templates.env.auto_reload = False
 
-# 全局异常处理
-@app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException):
-    """处理自定义业务异常"""
-    logger.warning(f"App exception: {exc.message}")
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.message},
-    )
+# 模板通过 static_url() 引用带内容指纹的静态资源 URL
+_STATIC_URLS = build_static_urls(_STATIC_DIR)
+templates.env.globals["static_url"] = (
+    lambda path: _STATIC_URLS.get(path, f"/static/{path}")
+)
 
+# 页面路由表：路径 -> (模板, 渲染上下文)
+_PAGES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "/": ("index.html", {"app_name": settings.APP_NAME}),
+    "/login": ("auth/login.html", {}),
+    "/register": ("auth/register.html", {}),
+    "/tasks": ("tasks/list.html", {}),
+    "/categories": ("categories/list.html", {}),
+    "/tags": ("tags/list.html", {}),
+    "/profile": ("profile/index.html", {}),
+}
+
+# 页面模板不依赖请求数据，启动时渲染一次，请求时直接返回 HTML 字节
+_PAGE_HTML: Dict[str, bytes] = {
+    path: templates.get_template(name).render(context).encode("utf-8")
+    for path, (name, context) in _PAGES.items()
+}
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """处理未捕获的异常"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error"},
-    )
+# 注册 API 路由
+app.include_router(api_router, prefix="/api/v1")
 
 
 # 健康检查
-@app.get("/health", tags=["Health"], summary="健康检查")
+@app.get(
+    "/health",
+    tags=["Health"],
+    summary="健康检查",
+    response_model=HealthResponse,
+)
 async def health_check():
     """
     健康检查接口
@@ -130,70 +151,32 @@ async def health_check():
 
 # ====== Web 页面路由 ======
 
-@app.get("/", include_in_schema=False)
-async def index(request: Request):
-    """Web 首页"""
-    return templates.TemplateResponse(
-        "index.html",
-        {"request": request, "app_name": settings.APP_NAME},
-    )
-
-
-@app.get("/login", include_in_schema=False)
-async def login_page(request: Request):
-    """登录页面"""
-    return templates.TemplateResponse(
-        "auth/login.html",
-        {"request": request},
-    )
-
-
-@app.get("/register", include_in_schema=False)
-async def register_page(request: Request):
-    """注册页面"""
-    return templates.TemplateResponse(
-        "auth/register.html",
-        {"request": request},
-    )
-
-
-@app.get("/tasks", include_in_schema=False)
-async def tasks_page(request: Request):
-    """任务列表页面"""
-    return templates.TemplateResponse(
-        "tasks/list.html",
-        {"request": request},
-    )
-
+def _page_endpoint(body: bytes) -> Callable[[Request], Awaitable[HTMLResponse]]:
+    """
+    构建返回预渲染 HTML 的页面处理函数
 
-@app.get("/categories", include_in_schema=False)
-async def categories_page(request: Request):
-    """分类管理页面"""
-    return templates.TemplateResponse(
-        "categories/list.html",
-        {"request": request},
-    )
+    Args:
+        body: 预渲染的页面 HTML 字节
 
+    Returns:
+        页面处理函数
+    """
+    async def page(request: Request) -> HTMLResponse:
+        return HTMLResponse(body)
 
-@app.get("/tags", include_in_schema=False)
-async def tags_page(request: Request):
-    """标签管理页面"""
-    return templates.TemplateResponse(
-        "tags/list.html",
-        {"request": request},
-    )
+    return page
 
 
-@app.get("/profile", include_in_schema=False)
-async def profile_page(request: Request):
-    """个人资料页面"""
-    return templates.TemplateResponse(
-        "profile/index.html",
-        {"request": request},
+# 页面无参数，直接注册为 Starlette 路由，跳过 FastAPI 的依赖解析
+for _path, _body in _PAGE_HTML.items():
+    app.add_route(
+        _path, _page_endpoint(_body), methods=["GET"], include_in_schema=False
     )
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
     uvicorn.run(
@@ -201,4 +184,11 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        # reload 模式只支持单进程；生产环境按 WEB_CONCURRENCY 启动多个 worker
+        workers=1 if settings.DEBUG else int(os.environ.get("WEB_CONCURRENCY", "1")),
+        # uvloop 事件循环 + httptools 解析器（uvicorn[standard] 已包含）
+        loop="uvloop",
+        http="httptools",
+        # 访问日志逐请求写入，开销明显，仅在调试时开启
+        access_log=settings.DEBUG,
     )
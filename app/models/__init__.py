@@ -1,8 +1,13 @@
+from sqlalchemy.orm import configure_mappers
+
 from app.models.user import User
 from app.models.task import Task, TaskStatus, TaskPriority, task_tags
 from app.models.category import Category
 from app.models.tag import Tag
 
+# 全部模型导入后立即配置映射关系，避免首个请求承担映射编译开销
+configure_mappers()
+
 __all__ = [
     "User",
     "Task",
@@ -4,28 +4,46 @@
 """
 from datetime import datetime
 
-from sqlalchemy import Integer, DateTime
+from sqlalchemy import Integer, DateTime, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
 
+# 时间戳列类型
+# SQLite 的 CURRENT_TIMESTAMP 精确到秒（YYYY-MM-DD HH:MM:SS），而默认绑定参数
+# 带微秒；两者按字符串比较时同一时刻会不相等（游标分页依赖该比较），
+# 因此 SQLite 上统一按秒存储
+TimestampType = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format=(
+            "%(year)04d-%(month)02d-%(day)02d "
+            "%(hour)02d:%(minute)02d:%(second)02d"
+        ),
+    ),
+    "sqlite",
+)
+
+
 class TimestampMixin:
     """
     时间戳混入类
 
-    为模型提供 created_at 和 updated_at 字段
+    为模型提供 created_at 和 updated_at 字段，时间由数据库生成：
+    INSERT 使用列默认值，UPDATE 在 SET 子句中写入 CURRENT_TIMESTAMP，
+    生成的值在 create/update 的 refresh 中读回
     """
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        TimestampType,
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        TimestampType,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
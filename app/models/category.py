@@ -44,11 +44,10 @@ class Category(BaseModel):
     # 外键
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         comment="所属用户ID",
     )
 
-    # 关系定义
+    # 关系定义（集合默认按需加载，需要时在查询中用 selectinload 显式预加载）
     user: Mapped["User"] = relationship(
         "User",
         back_populates="categories",
@@ -56,7 +55,6 @@ class Category(BaseModel):
     tasks: Mapped[List["Task"]] = relationship(
         "Task",
         back_populates="category",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
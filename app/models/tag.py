@@ -38,11 +38,10 @@ class Tag(BaseModel):
     # 外键
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         comment="所属用户ID",
     )
 
-    # 关系定义
+    # 关系定义（集合默认按需加载，需要时在查询中用 selectinload 显式预加载）
     user: Mapped["User"] = relationship(
         "User",
         back_populates="tags",
@@ -51,7 +50,6 @@ class Tag(BaseModel):
         "Task",
         secondary="task_tags",
         back_populates="tags",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
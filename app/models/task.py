@@ -5,7 +5,18 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Text, Enum, ForeignKey, DateTime, Table, Column, Integer
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -17,15 +28,19 @@ if TYPE_CHECKING:
     from app.models.tag import Tag
 
 
-class TaskStatus(str, enum.Enum):
-    """任务状态枚举"""
+class TaskStatus(enum.StrEnum):
+    """
+    任务状态枚举
+
+    数据库以 VARCHAR 存储枚举值，StrEnum 成员本身即字符串，可直接作为参数绑定
+    """
     PENDING = "pending"           # 待处理
     IN_PROGRESS = "in_progress"   # 进行中
     COMPLETED = "completed"       # 已完成
     ARCHIVED = "archived"         # 已归档
 
 
-class TaskPriority(str, enum.Enum):
+class TaskPriority(enum.StrEnum):
     """任务优先级枚举"""
     LOW = "low"           # 低
     MEDIUM = "medium"     # 中
@@ -49,6 +64,8 @@ task_tags = Table(
         ForeignKey("tags.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # 主键以 task_id 开头，按 tag_id 反查任务（删除标签级联）需单独索引
+    Index("ix_task_tags_tag_id", "tag_id"),
 )
 
 
@@ -59,6 +76,35 @@ class Task(BaseModel):
     核心业务实体，支持状态管理、优先级、分类和标签
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 任务列表查询：每种筛选组合都有等值前缀 + created_at 倒序的索引，
+        # 分页时按索引顺序扫描，无需 filesort
+        # user_id 前缀同时覆盖按用户查询和外键，无需单列索引
+        Index("ix_tasks_user_created", "user_id", text("created_at DESC")),
+        Index(
+            "ix_tasks_user_status_created",
+            "user_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        Index(
+            "ix_tasks_user_cat_created",
+            "user_id",
+            "category_id",
+            text("created_at DESC"),
+        ),
+        # 截止日期查询：按用户筛选后按 due_date 范围扫描
+        Index("ix_tasks_user_due", "user_id", "due_date"),
+        # 状态/优先级存为 VARCHAR，取值由 CHECK 约束保证
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s.value}'" for s in TaskStatus)),
+            name="ck_tasks_status",
+        ),
+        CheckConstraint(
+            "priority IN ({})".format(", ".join(f"'{p.value}'" for p in TaskPriority)),
+            name="ck_tasks_priority",
+        ),
+    )
 
     title: Mapped[str] = mapped_column(
         String(200),
@@ -70,28 +116,25 @@ class Task(BaseModel):
         nullable=True,
         comment="任务描述",
     )
-    status: Mapped[TaskStatus] = mapped_column(
-        Enum(TaskStatus),
+    status: Mapped[str] = mapped_column(
+        String(20),
         default=TaskStatus.PENDING,
-        index=True,
         comment="任务状态",
     )
-    priority: Mapped[TaskPriority] = mapped_column(
-        Enum(TaskPriority),
+    priority: Mapped[str] = mapped_column(
+        String(20),
         default=TaskPriority.MEDIUM,
         comment="优先级",
     )
     due_date: Mapped[Optional[datetime]] = mapped_column(
         DateTime,
         nullable=True,
-        index=True,
         comment="截止日期",
     )
 
     # 外键
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         comment="所属用户ID",
     )
     category_id: Mapped[Optional[int]] = mapped_column(
@@ -47,24 +47,21 @@ class User(BaseModel):
         comment="是否激活",
     )
 
-    # 关系定义
+    # 关系定义（集合默认按需加载，需要时在查询中用 selectinload 显式预加载）
     tasks: Mapped[List["Task"]] = relationship(
         "Task",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
     categories: Mapped[List["Category"]] = relationship(
         "Category",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
     tags: Mapped[List["Tag"]] = relationship(
         "Tag",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
@@ -2,9 +2,9 @@
 Repository 基类模块
 实现通用 CRUD 操作，体现泛型编程和代码复用
 """
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, List, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, lambda_stmt, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.base import BaseModel
@@ -34,11 +34,15 @@ class BaseRepository(Generic[ModelType]):
     async def get_by_id(
         self,
         id: int,
-        options: Optional[List[Any]] = None,
+        options: Optional[Sequence[Any]] = None,
     ) -> Optional[ModelType]:
         """
         根据 ID 获取单个实体
 
+        无加载选项时使用 Session.get：对象已在会话 identity map 中时直接返回，
+        不发 SQL。带加载选项时仍发出查询，因为 Session.get 命中 identity map
+        会忽略选项，返回的对象可能缺少预加载的关联
+
         Args:
             id: 实体 ID
             options: SQLAlchemy 查询选项（如 selectinload）
@@ -46,10 +50,10 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             实体对象或 None
         """
-        query = select(self.model).where(self.model.id == id)
-        if options:
-            for opt in options:
-                query = query.options(opt)
+        if not options:
+            return await self.db.get(self.model, id)
+
+        query = select(self.model).where(self.model.id == id).options(*options)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -59,8 +63,8 @@ class BaseRepository(Generic[ModelType]):
         limit: int = 100,
         filters: Optional[List[Any]] = None,
         order_by: Optional[Any] = None,
-        options: Optional[List[Any]] = None,
-    ) -> List[ModelType]:
+        options: Optional[Sequence[Any]] = None,
+    ) -> Sequence[ModelType]:
         """
         获取实体列表（支持分页、过滤、排序）
 
@@ -89,7 +93,7 @@ class BaseRepository(Generic[ModelType]):
 
         query = query.offset(skip).limit(limit)
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def count(self, filters: Optional[List[Any]] = None) -> int:
         """
@@ -148,7 +152,10 @@ class BaseRepository(Generic[ModelType]):
 
     async def delete(self, id: int) -> bool:
         """
-        删除实体
+        按 ID 删除实体
+
+        直接发出 DELETE 语句，不扫描会话 identity map 同步状态，
+        关联数据由数据库外键 ON DELETE 规则处理
 
         Args:
             id: 实体 ID
@@ -156,7 +163,11 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             是否删除成功
         """
-        query = delete(self.model).where(self.model.id == id)
+        query = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self.db.execute(query)
         return result.rowcount > 0
 
@@ -170,6 +181,10 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             是否存在
         """
-        query = select(func.count()).select_from(self.model).where(self.model.id == id)
+        model = self.model
+        # lambda_stmt 以 lambda 代码位置为缓存键，跳过语句构造和缓存键计算
+        query = lambda_stmt(
+            lambda: select(literal(1)).where(model.id == id).limit(1)
+        )
         result = await self.db.execute(query)
-        return (result.scalar() or 0) > 0
+        return result.scalar() is not None
@@ -1,9 +1,9 @@
 """
 分类数据访问层
 """
-from typing import List, Optional
+from typing import Optional, Sequence
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category
@@ -25,7 +25,7 @@ class CategoryRepository(BaseRepository[Category]):
         user_id: int,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Category]:
+    ) -> Sequence[Category]:
         """
         获取用户的所有分类
 
@@ -76,5 +76,10 @@ class CategoryRepository(BaseRepository[Category]):
         Returns:
             是否存在
         """
-        category = await self.get_by_name(user_id, name)
-        return category is not None
+        query = (
+            select(literal(1))
+            .where(and_(Category.user_id == user_id, Category.name == name))
+            .limit(1)
+        )
+        result = await self.db.execute(query)
+        return result.scalar() is not None
@@ -1,9 +1,9 @@
 """
 标签数据访问层
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Set
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tag import Tag
@@ -25,7 +25,7 @@ class TagRepository(BaseRepository[Tag]):
         user_id: int,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[Tag]:
+    ) -> Sequence[Tag]:
         """
         获取用户的所有标签
 
@@ -65,29 +65,31 @@ class TagRepository(BaseRepository[Tag]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_by_ids(
+    async def get_valid_tag_ids(
         self,
         user_id: int,
         tag_ids: List[int],
-    ) -> List[Tag]:
+    ) -> Set[int]:
         """
-        根据 ID 列表获取标签（仅限用户自己的）
+        筛选属于用户的标签 ID
+
+        只查询 ID 列，不构建 Tag 对象
 
         Args:
             user_id: 用户 ID
-            tag_ids: 标签 ID 列表
+            tag_ids: 待校验的标签 ID 列表
 
         Returns:
-            标签列表
+            属于该用户的标签 ID 集合
         """
         if not tag_ids:
-            return []
+            return set()
 
-        query = select(Tag).where(
+        query = select(Tag.id).where(
             and_(Tag.user_id == user_id, Tag.id.in_(tag_ids))
         )
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return set(result.scalars().all())
 
     async def name_exists(self, user_id: int, name: str) -> bool:
         """
@@ -100,5 +102,10 @@ class TagRepository(BaseRepository[Tag]):
         Returns:
             是否存在
         """
-        tag = await self.get_by_name(user_id, name)
-        return tag is not None
+        query = (
+            select(literal(1))
+            .where(and_(Tag.user_id == user_id, Tag.name == name))
+            .limit(1)
+        )
+        result = await self.db.execute(query)
+        return result.scalar() is not None
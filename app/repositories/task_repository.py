@@ -1,15 +1,32 @@
 """
 任务数据访问层
 """
-from typing import Dict, List, Optional
-
-from sqlalchemy import func, select
+from typing import Any, Dict, List, Optional, Sequence, cast
+
+from sqlalchemy import (
+    and_,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.models.task import Task, TaskStatus
-from app.models.tag import Tag
+from app.models.task import Task, TaskStatus, task_tags
 from app.repositories.base import BaseRepository
+from app.utils.pagination import CursorKey
+
+# 任务关联的预加载策略，避免逐行懒加载（N+1）：
+# 多对一的分类随主查询 LEFT JOIN 取回；多对多的标签用一条 IN 查询，避免 JOIN 行膨胀
+_TASK_RELATION_OPTIONS = (
+    joinedload(Task.category),
+    selectinload(Task.tags),
+)
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -29,37 +46,50 @@ class TaskRepository(BaseRepository[Task]):
         category_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> List[Task]:
+        cursor: Optional[CursorKey] = None,
+    ) -> Sequence[Task]:
         """
         获取用户的任务列表（带预加载关联数据）
 
+        按 (created_at, id) 倒序排列。传入 cursor 时使用键集分页，
+        从游标位置直接在索引上定位，忽略 skip，深分页也无需扫描丢弃前面的行
+
         Args:
             user_id: 用户 ID
             status: 任务状态筛选
             category_id: 分类 ID 筛选
-            skip: 跳过记录数
+            skip: 跳过记录数（OFFSET 分页）
             limit: 返回记录数
+            cursor: 上一页最后一条记录的 (created_at, id)
 
         Returns:
             任务列表
         """
-        filters = [Task.user_id == user_id]
+        query = select(Task).where(Task.user_id == user_id)
 
         if status:
-            filters.append(Task.status == status)
+            query = query.where(Task.status == status)
         if category_id:
-            filters.append(Task.category_id == category_id)
+            query = query.where(Task.category_id == category_id)
+
+        if cursor is not None:
+            created_at, task_id = cursor
+            query = query.where(
+                or_(
+                    Task.created_at < created_at,
+                    and_(Task.created_at == created_at, Task.id < task_id),
+                )
+            )
+        else:
+            query = query.offset(skip)
 
-        return await self.get_all(
-            skip=skip,
-            limit=limit,
-            filters=filters,
-            order_by=Task.created_at.desc(),
-            options=[
-                selectinload(Task.category),
-                selectinload(Task.tags),
-            ],
+        query = (
+            query.options(*_TASK_RELATION_OPTIONS)
+            .order_by(Task.created_at.desc(), Task.id.desc())
+            .limit(limit)
         )
+        result = await self.db.execute(query)
+        return result.scalars().all()
 
     async def get_task_with_relations(self, task_id: int) -> Optional[Task]:
         """
@@ -73,16 +103,85 @@ class TaskRepository(BaseRepository[Task]):
         """
         return await self.get_by_id(
             task_id,
-            options=[
-                selectinload(Task.category),
-                selectinload(Task.tags),
-            ],
+            options=_TASK_RELATION_OPTIONS,
+        )
+
+    async def delete_user_task(self, task_id: int, user_id: int) -> bool:
+        """
+        删除属于指定用户的任务
+
+        归属条件并入 DELETE 的 WHERE 子句，一条语句完成权限校验和删除，
+        标签关联由数据库外键 ON DELETE CASCADE 清理
+
+        Args:
+            task_id: 任务 ID
+            user_id: 用户 ID
+
+        Returns:
+            是否删除成功（任务不存在或不属于该用户时为 False）
+        """
+        query = (
+            delete(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .execution_options(synchronize_session=False)
         )
+        # DML 语句的执行结果为 CursorResult，带有 rowcount
+        result = cast(CursorResult[Any], await self.db.execute(query))
+        return result.rowcount > 0
+
+    async def update_status_owned(
+        self,
+        task_id: int,
+        user_id: int,
+        status: TaskStatus,
+    ) -> int:
+        """
+        更新属于指定用户的任务状态
+
+        归属条件并入 UPDATE 的 WHERE 子句，一条语句完成权限校验和更新。
+        会话中已有的任务对象按表达式就地同步状态，updated_at 被标记为过期，
+        随后的查询会重新加载
+
+        Args:
+            task_id: 任务 ID
+            user_id: 用户 ID
+            status: 新状态
+
+        Returns:
+            受影响的行数（任务不存在或不属于该用户时为 0）
+        """
+        query = (
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(status=status)
+            .execution_options(synchronize_session="evaluate")
+        )
+        result = cast(CursorResult[Any], await self.db.execute(query))
+        return result.rowcount
+
+    async def load_relations(self, task: Task) -> Task:
+        """
+        加载任务的分类和标签关联
+
+        写操作中的 refresh 会使关联失效，响应序列化时再访问会触发
+        异步会话不支持的懒加载，因此在返回前显式加载
+
+        Args:
+            task: 任务对象
+
+        Returns:
+            已加载关联的任务
+        """
+        await self.db.refresh(task, attribute_names=["category", "tags"])
+        return task
 
     async def update_task_tags(self, task: Task, tag_ids: List[int]) -> Task:
         """
         更新任务的标签关联
 
+        直接对关联表执行 DELETE + 批量 INSERT，两条语句完成替换，不加载 Tag 对象，
+        标签归属需由调用方预先校验。执行后 task.tags 已过期，需通过 load_relations 重新加载
+
         Args:
             task: 任务对象
             tag_ids: 标签 ID 列表
@@ -90,36 +189,40 @@ class TaskRepository(BaseRepository[Task]):
         Returns:
             更新后的任务
         """
+        await self.db.execute(
+            delete(task_tags).where(task_tags.c.task_id == task.id)
+        )
         if tag_ids:
-            query = select(Tag).where(Tag.id.in_(tag_ids))
-            result = await self.db.execute(query)
-            tags = list(result.scalars().all())
-        else:
-            tags = []
+            await self.db.execute(
+                insert(task_tags),
+                [{"task_id": task.id, "tag_id": tag_id} for tag_id in tag_ids],
+            )
 
-        task.tags = tags
-        await self.db.flush()
-        await self.db.refresh(task)
+        self.db.expire(task, ["tags"])
         return task
 
-    async def count_by_status(self, user_id: int) -> Dict[TaskStatus, int]:
+    async def count_by_status(self, user_id: int) -> Dict[str, int]:
         """
         统计用户各状态的任务数量
 
+        单条 GROUP BY 查询在数据库端聚合，可直接走 (user_id, status, ...)
+        复合索引，无需加载任务行
+
         Args:
             user_id: 用户 ID
 
         Returns:
             状态到数量的映射
         """
-        query = (
-            select(Task.status, func.count(Task.id).label("count"))
+        query = lambda_stmt(
+            lambda: select(Task.status, func.count().label("count"))
             .where(Task.user_id == user_id)
             .group_by(Task.status)
         )
 
         result = await self.db.execute(query)
-        return {row.status: row.count for row in result}
+        # status 为 VARCHAR，行即 (状态, 数量) 元组，直接构造字典
+        return dict(result.all())
 
     async def count_user_tasks(
         self,
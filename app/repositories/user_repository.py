@@ -1,9 +1,9 @@
 """
 用户数据访问层
 """
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from sqlalchemy import select
+from sqlalchemy import case, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -20,6 +20,30 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, db: AsyncSession):
         super().__init__(User, db)
 
+    async def get_auth_snapshot(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        获取认证所需的用户基本字段
+
+        只查询必要的列，不加载密码哈希和关联集合
+
+        Args:
+            user_id: 用户 ID
+
+        Returns:
+            用户字段字典或 None
+        """
+        query = select(
+            User.id,
+            User.username,
+            User.email,
+            User.is_active,
+            User.created_at,
+            User.updated_at,
+        ).where(User.id == user_id)
+        result = await self.db.execute(query)
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         根据邮箱获取用户
@@ -58,8 +82,9 @@ class UserRepository(BaseRepository[User]):
         Returns:
             是否存在
         """
-        user = await self.get_by_email(email)
-        return user is not None
+        query = select(literal(1)).where(User.email == email).limit(1)
+        result = await self.db.execute(query)
+        return result.scalar() is not None
 
     async def username_exists(self, username: str) -> bool:
         """
@@ -71,5 +96,33 @@ class UserRepository(BaseRepository[User]):
         Returns:
             是否存在
         """
-        user = await self.get_by_username(username)
-        return user is not None
+        query = select(literal(1)).where(User.username == username).limit(1)
+        result = await self.db.execute(query)
+        return result.scalar() is not None
+
+    async def email_or_username_taken(
+        self,
+        email: str,
+        username: str,
+    ) -> Optional[str]:
+        """
+        一次查询检查邮箱和用户名是否已被占用
+
+        两者都冲突时优先报告邮箱
+
+        Args:
+            email: 邮箱地址
+            username: 用户名
+
+        Returns:
+            冲突的字段名 "email" / "username"，均未占用返回 None
+        """
+        taken = case((User.email == email, "email"), else_="username")
+        query = (
+            select(taken)
+            .where(or_(User.email == email, User.username == username))
+            .order_by(taken)
+            .limit(1)
+        )
+        result = await self.db.execute(query)
+        return result.scalar()
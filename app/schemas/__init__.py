@@ -9,6 +9,7 @@ from app.schemas.task import (
     TaskUpdate,
     TaskResponse,
     TaskListResponse,
+    TaskStatistics,
     TaskStatus,
     TaskPriority,
 )
@@ -28,6 +29,7 @@ from app.schemas.auth import (
     LoginRequest,
 )
 from app.schemas.common import (
+    HealthResponse,
     MessageResponse,
     PaginationParams,
 )
@@ -43,6 +45,7 @@ __all__ = [
     "TaskUpdate",
     "TaskResponse",
     "TaskListResponse",
+    "TaskStatistics",
     "TaskStatus",
     "TaskPriority",
     # Category
@@ -58,6 +61,7 @@ __all__ = [
     "TokenPayload",
     "LoginRequest",
     # Common
+    "HealthResponse",
     "MessageResponse",
     "PaginationParams",
 ]
@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.common import HEX_COLOR_PATTERN
+
 
 class CategoryBase(BaseModel):
     """分类基础 Schema"""
@@ -22,7 +24,7 @@ class CategoryBase(BaseModel):
     )
     color: str = Field(
         default="#3B82F6",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
+        pattern=HEX_COLOR_PATTERN,
         description="颜色（HEX格式）",
     )
 
@@ -36,7 +38,7 @@ class CategoryUpdate(BaseModel):
     """更新分类请求"""
     name: Optional[str] = Field(None, min_length=1, max_length=50)
     description: Optional[str] = Field(None, max_length=200)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[str] = Field(None, pattern=HEX_COLOR_PATTERN)
 
 
 class CategoryResponse(CategoryBase):
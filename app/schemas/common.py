@@ -3,12 +3,23 @@
 """
 from pydantic import BaseModel, Field
 
+# 字段校验正则，作为 Field(pattern=...) 在 schema 构建时由 pydantic-core 编译一次
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+USERNAME_PATTERN = r"^[a-zA-Z0-9_]+$"
+
 
 class MessageResponse(BaseModel):
     """通用消息响应"""
     message: str
 
 
+class HealthResponse(BaseModel):
+    """健康检查响应"""
+    status: str
+    version: str
+    app_name: str
+
+
 class PaginationParams(BaseModel):
     """分页参数"""
     page: int = Field(default=1, ge=1, description="页码")
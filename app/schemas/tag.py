@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.common import HEX_COLOR_PATTERN
+
 
 class TagBase(BaseModel):
     """标签基础 Schema"""
@@ -17,7 +19,7 @@ class TagBase(BaseModel):
     )
     color: str = Field(
         default="#10B981",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
+        pattern=HEX_COLOR_PATTERN,
         description="颜色（HEX格式）",
     )
 
@@ -30,7 +32,7 @@ class TagCreate(TagBase):
 class TagUpdate(BaseModel):
     """更新标签请求"""
     name: Optional[str] = Field(None, min_length=1, max_length=30)
-    color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[str] = Field(None, pattern=HEX_COLOR_PATTERN)
 
 
 class TagResponse(TagBase):
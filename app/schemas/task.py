@@ -2,13 +2,13 @@
 任务相关 Schema
 """
 from datetime import datetime
-from enum import Enum
-from typing import List, Optional
+from enum import StrEnum
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """任务状态"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -16,7 +16,7 @@ class TaskStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-class TaskPriority(str, Enum):
+class TaskPriority(StrEnum):
     """任务优先级"""
     LOW = "low"
     MEDIUM = "medium"
@@ -104,6 +104,10 @@ class TaskResponse(TaskBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# 任务列表适配器，一次调用完成整个列表的 ORM 对象校验
+TASK_LIST_ADAPTER: TypeAdapter[List[TaskResponse]] = TypeAdapter(List[TaskResponse])
+
+
 class TaskListResponse(BaseModel):
     """任务列表响应（分页）"""
     items: List[TaskResponse]
@@ -111,3 +115,11 @@ class TaskListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+
+
+class TaskStatistics(BaseModel):
+    """任务统计响应"""
+    total: int
+    by_status: Dict[str, int]
+    completion_rate: float
@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from app.schemas.common import USERNAME_PATTERN
+
 
 class UserBase(BaseModel):
     """用户基础 Schema"""
@@ -13,7 +15,7 @@ class UserBase(BaseModel):
         ...,
         min_length=3,
         max_length=50,
-        pattern=r"^[a-zA-Z0-9_]+$",
+        pattern=USERNAME_PATTERN,
         description="用户名（3-50字符，仅字母数字下划线）",
     )
     email: EmailStr = Field(..., description="邮箱地址")
@@ -35,7 +37,7 @@ class UserUpdate(BaseModel):
         None,
         min_length=3,
         max_length=50,
-        pattern=r"^[a-zA-Z0-9_]+$",
+        pattern=USERNAME_PATTERN,
     )
     email: Optional[EmailStr] = None
     password: Optional[str] = Field(None, min_length=6, max_length=100)
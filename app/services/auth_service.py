@@ -5,22 +5,22 @@
 from datetime import timedelta
 from typing import Optional
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.exceptions import BadRequestException, UnauthorizedException
 from app.core.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_dummy_password_async,
+    verify_password_async,
 )
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import Token
 from app.schemas.user import UserCreate
 
-settings = get_settings()
-
 
 class AuthService:
     """
@@ -46,22 +46,28 @@ class AuthService:
         Raises:
             BadRequestException: 邮箱或用户名已存在
         """
-        # 检查邮箱是否已存在
-        if await self.user_repo.email_exists(user_in.email):
+        # 一次查询同时检查邮箱和用户名
+        taken = await self.user_repo.email_or_username_taken(
+            user_in.email, user_in.username
+        )
+        if taken == "email":
             raise BadRequestException("Email already registered")
-
-        # 检查用户名是否已存在
-        if await self.user_repo.username_exists(user_in.username):
+        if taken is not None:
             raise BadRequestException("Username already taken")
 
         # 创建用户
         user_data = {
             "username": user_in.username,
             "email": user_in.email,
-            "hashed_password": get_password_hash(user_in.password),
+            "hashed_password": await get_password_hash_async(user_in.password),
         }
 
-        return await self.user_repo.create(user_data)
+        # 并发注册时预检查可能都通过，由唯一索引兜底
+        try:
+            return await self.user_repo.create(user_data)
+        except IntegrityError:
+            await self.db.rollback()
+            raise BadRequestException("Email or username already registered")
 
     async def authenticate(
         self,
@@ -78,12 +84,17 @@ class AuthService:
         Returns:
             验证成功返回用户，否则返回 None
         """
+        # 空密码不可能匹配，无需查库和计算哈希
+        if not password:
+            return None
+
         user = await self.user_repo.get_by_email(email)
 
         if not user:
+            await verify_dummy_password_async(password)
             return None
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
 
         return user
@@ -2,8 +2,9 @@
 分类服务
 处理任务分类相关业务逻辑
 """
-from typing import List
+from typing import Sequence
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
@@ -45,16 +46,17 @@ class CategoryService:
         Raises:
             BadRequestException: 分类名称已存在
         """
-        # 检查名称是否重复
-        if await self.category_repo.name_exists(user_id, category_in.name):
-            raise BadRequestException(
-                f"Category '{category_in.name}' already exists"
-            )
-
         category_data = category_in.model_dump()
         category_data["user_id"] = user_id
 
-        return await self.category_repo.create(category_data)
+        # 直接插入，名称重复由唯一约束 (user_id, name) 拦截，省去预先查询
+        try:
+            return await self.category_repo.create(category_data)
+        except IntegrityError:
+            await self.db.rollback()
+            raise BadRequestException(
+                f"Category '{category_in.name}' already exists"
+            )
 
     async def get_category(
         self,
@@ -87,7 +89,7 @@ class CategoryService:
 
         return category
 
-    async def get_user_categories(self, user_id: int) -> List[Category]:
+    async def get_user_categories(self, user_id: int) -> Sequence[Category]:
         """
         获取用户的所有分类
 
@@ -117,15 +119,23 @@ class CategoryService:
             更新后的分类
         """
         category = await self.get_category(category_id, user_id)
+        # 客户端常回传整个对象，只保留与当前值不同的字段
+        update_data = {
+            key: value
+            for key, value in category_in.model_dump(exclude_unset=True).items()
+            if getattr(category, key) != value
+        }
+
+        # 没有需要更新的字段时不发出 UPDATE
+        if not update_data:
+            return category
 
         # 检查名称是否冲突
-        if category_in.name and category_in.name != category.name:
-            if await self.category_repo.name_exists(user_id, category_in.name):
-                raise BadRequestException(
-                    f"Category '{category_in.name}' already exists"
-                )
+        name = update_data.get("name")
+        if name:
+            if await self.category_repo.name_exists(user_id, name):
+                raise BadRequestException(f"Category '{name}' already exists")
 
-        update_data = category_in.model_dump(exclude_unset=True)
         return await self.category_repo.update(category, update_data)
 
     async def delete_category(
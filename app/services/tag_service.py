@@ -2,8 +2,9 @@
 标签服务
 处理任务标签相关业务逻辑
 """
-from typing import List
+from typing import Sequence
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
@@ -41,14 +42,15 @@ class TagService:
         Raises:
             BadRequestException: 标签名称已存在
         """
-        # 检查名称是否重复
-        if await self.tag_repo.name_exists(user_id, tag_in.name):
-            raise BadRequestException(f"Tag '{tag_in.name}' already exists")
-
         tag_data = tag_in.model_dump()
         tag_data["user_id"] = user_id
 
-        return await self.tag_repo.create(tag_data)
+        # 直接插入，名称重复由唯一约束 (user_id, name) 拦截，省去预先查询
+        try:
+            return await self.tag_repo.create(tag_data)
+        except IntegrityError:
+            await self.db.rollback()
+            raise BadRequestException(f"Tag '{tag_in.name}' already exists")
 
     async def get_tag(self, tag_id: int, user_id: int) -> Tag:
         """
@@ -75,7 +77,7 @@ class TagService:
 
         return tag
 
-    async def get_user_tags(self, user_id: int) -> List[Tag]:
+    async def get_user_tags(self, user_id: int) -> Sequence[Tag]:
         """
         获取用户的所有标签
 
@@ -105,13 +107,23 @@ class TagService:
             更新后的标签
         """
         tag = await self.get_tag(tag_id, user_id)
+        # 客户端常回传整个对象，只保留与当前值不同的字段
+        update_data = {
+            key: value
+            for key, value in tag_in.model_dump(exclude_unset=True).items()
+            if getattr(tag, key) != value
+        }
+
+        # 没有需要更新的字段时不发出 UPDATE
+        if not update_data:
+            return tag
 
         # 检查名称是否冲突
-        if tag_in.name and tag_in.name != tag.name:
-            if await self.tag_repo.name_exists(user_id, tag_in.name):
-                raise BadRequestException(f"Tag '{tag_in.name}' already exists")
+        name = update_data.get("name")
+        if name:
+            if await self.tag_repo.name_exists(user_id, name):
+                raise BadRequestException(f"Tag '{name}' already exists")
 
-        update_data = tag_in.model_dump(exclude_unset=True)
         return await self.tag_repo.update(tag, update_data)
 
     async def delete_tag(self, tag_id: int, user_id: int) -> bool:
@@ -6,16 +6,21 @@ from typing import Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import ForbiddenException, NotFoundException
+from app.core.exceptions import (
+    BadRequestException,
+    ForbiddenException,
+    NotFoundException,
+)
 from app.models.task import Task, TaskStatus
 from app.repositories.task_repository import TaskRepository
 from app.repositories.tag_repository import TagRepository
 from app.schemas.task import (
+    TASK_LIST_ADAPTER,
     TaskCreate,
     TaskListResponse,
-    TaskResponse,
     TaskUpdate,
 )
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class TaskService:
@@ -52,11 +57,13 @@ class TaskService:
         # 关联标签
         if task_in.tag_ids:
             # 验证标签属于该用户
-            valid_tags = await self.tag_repo.get_by_ids(user_id, task_in.tag_ids)
-            if valid_tags:
-                task = await self.task_repo.update_task_tags(task, [t.id for t in valid_tags])
+            valid_tag_ids = await self.tag_repo.get_valid_tag_ids(
+                user_id, task_in.tag_ids
+            )
+            if valid_tag_ids:
+                task = await self.task_repo.update_task_tags(task, list(valid_tag_ids))
 
-        return task
+        return await self.task_repo.load_relations(task)
 
     async def get_task(self, task_id: int, user_id: int) -> Task:
         """
@@ -90,46 +97,72 @@ class TaskService:
         category_id: Optional[int] = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> TaskListResponse:
         """
         获取用户任务列表（分页）
 
+        支持页码分页和游标分页：传入 cursor 时按游标定位并忽略 page，
+        响应中的 next_cursor 用于请求下一页，没有更多数据时为 None
+
         Args:
             user_id: 用户 ID
             status: 状态筛选
             category_id: 分类筛选
             page: 页码
             page_size: 每页数量
+            cursor: 上一页响应返回的 next_cursor
 
         Returns:
             分页任务列表响应
+
+        Raises:
+            BadRequestException: 游标格式无效
         """
+        cursor_key = None
+        if cursor is not None:
+            cursor_key = decode_cursor(cursor)
+            if cursor_key is None:
+                raise BadRequestException("Invalid pagination cursor")
+
         skip = (page - 1) * page_size
 
-        # 获取任务列表
+        # 多取一条用于判断是否还有下一页
         tasks = await self.task_repo.get_user_tasks(
             user_id=user_id,
             status=status,
             category_id=category_id,
             skip=skip,
-            limit=page_size,
+            limit=page_size + 1,
+            cursor=cursor_key,
         )
 
-        # 获取总数
-        total = await self.task_repo.count_user_tasks(
-            user_id=user_id,
-            status=status,
-            category_id=category_id,
-        )
+        next_cursor = None
+        if len(tasks) > page_size:
+            tasks = tasks[:page_size]
+            last = tasks[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        # 页码分页的最后一页（非空或第一页）可直接推算总数，省去 COUNT 查询；
+        # 同一 AsyncSession 不支持并发语句，因此无法与列表查询并行执行
+        if cursor_key is None and next_cursor is None and (tasks or skip == 0):
+            total = skip + len(tasks)
+        else:
+            total = await self.task_repo.count_user_tasks(
+                user_id=user_id,
+                status=status,
+                category_id=category_id,
+            )
 
         total_pages = (total + page_size - 1) // page_size
 
         return TaskListResponse(
-            items=[TaskResponse.model_validate(t) for t in tasks],
+            items=TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
     async def update_task(
@@ -156,20 +189,20 @@ class TaskService:
         # 验证权限
         task = await self.get_task(task_id, user_id)
 
+        # 只导出一次，标签 ID 从同一个字典中取出
+        update_data = task_in.model_dump(exclude_unset=True)
+        tag_ids = update_data.pop("tag_ids", None)
+
         # 更新基本信息
-        update_data = task_in.model_dump(exclude_unset=True, exclude={"tag_ids"})
         if update_data:
             task = await self.task_repo.update(task, update_data)
 
         # 更新标签
-        if task_in.tag_ids is not None:
-            valid_tags = await self.tag_repo.get_by_ids(user_id, task_in.tag_ids)
-            task = await self.task_repo.update_task_tags(
-                task,
-                [t.id for t in valid_tags]
-            )
+        if tag_ids is not None:
+            valid_tag_ids = await self.tag_repo.get_valid_tag_ids(user_id, tag_ids)
+            task = await self.task_repo.update_task_tags(task, list(valid_tag_ids))
 
-        return task
+        return await self.task_repo.load_relations(task)
 
     async def delete_task(self, task_id: int, user_id: int) -> bool:
         """
@@ -186,9 +219,14 @@ class TaskService:
             NotFoundException: 任务不存在
             ForbiddenException: 无权操作
         """
-        # 验证权限
-        await self.get_task(task_id, user_id)
-        return await self.task_repo.delete(task_id)
+        # 归属校验并入 DELETE 语句，成功时只需一次往返
+        if await self.task_repo.delete_user_task(task_id, user_id):
+            return True
+
+        # 未删除时再区分任务不存在与无权操作
+        if await self.task_repo.exists(task_id):
+            raise ForbiddenException("You don't have permission to access this task")
+        raise NotFoundException(f"Task with id {task_id} not found")
 
     async def change_status(
         self,
@@ -207,8 +245,12 @@ class TaskService:
         Returns:
             更新后的任务
         """
-        task = await self.get_task(task_id, user_id)
-        return await self.task_repo.update(task, {"status": new_status})
+        # 归属校验并入 UPDATE 语句，不再先查询任务再更新
+        await self.task_repo.update_status_owned(task_id, user_id, new_status)
+
+        # 未更新任何行时 get_task 抛出不存在或无权操作异常，
+        # 更新成功时加载响应所需的分类和标签
+        return await self.get_task(task_id, user_id)
 
     async def get_task_statistics(self, user_id: int) -> Dict:
         """
@@ -223,12 +265,12 @@ class TaskService:
         status_counts = await self.task_repo.count_by_status(user_id)
         total = sum(status_counts.values())
 
-        # 计算各状态数量和完成率
-        completed = status_counts.get(TaskStatus.COMPLETED, 0)
+        # 计算完成率（count_by_status 以状态字符串为键）
+        completed = status_counts.get("completed", 0)
         completion_rate = (completed / total * 100) if total > 0 else 0
 
         return {
             "total": total,
-            "by_status": {str(k.value): v for k, v in status_counts.items()},
+            "by_status": status_counts,
             "completion_rate": round(completion_rate, 2),
         }
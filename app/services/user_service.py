@@ -6,8 +6,9 @@ from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_user_after_commit
 from app.core.exceptions import BadRequestException, NotFoundException
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserUpdate
@@ -78,9 +79,13 @@ class UserService:
 
         # 处理密码更新
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(
+                update_data.pop("password")
+            )
 
-        return await self.user_repo.update(user, update_data)
+        user = await self.user_repo.update(user, update_data)
+        invalidate_user_after_commit(self.db, user_id)
+        return user
 
     async def deactivate_user(self, user_id: int) -> User:
         """
@@ -93,4 +98,6 @@ class UserService:
             更新后的用户
         """
         user = await self.get_user(user_id)
-        return await self.user_repo.update(user, {"is_active": False})
+        user = await self.user_repo.update(user, {"is_active": False})
+        invalidate_user_after_commit(self.db, user_id)
+        return user
@@ -7,7 +7,7 @@ from pathlib import Path
 
 from loguru import logger
 
-from app.core.config import get_settings
+from app.core.config import settings
 
 
 def setup_logging() -> "logger":
@@ -18,8 +18,6 @@ def setup_logging() -> "logger":
     - 文件日志轮转
     - 结构化日志格式
     """
-    settings = get_settings()
-
     # 移除默认处理器
     logger.remove()
 
@@ -0,0 +1,45 @@
+"""
+游标分页工具模块
+将 (created_at, id) 排序键编码为不透明的游标字符串
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+# 游标对应的排序键：(created_at, id)
+CursorKey = Tuple[datetime, int]
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """
+    编码分页游标
+
+    Args:
+        created_at: 当前页最后一条记录的创建时间
+        item_id: 当前页最后一条记录的 ID
+
+    Returns:
+        URL 安全的 base64 游标字符串
+    """
+    raw = f"{created_at.isoformat()}|{item_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[CursorKey]:
+    """
+    解码分页游标
+
+    Args:
+        cursor: encode_cursor 生成的游标字符串
+
+    Returns:
+        (created_at, id) 排序键，游标格式无效返回 None
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded).decode("utf-8")
+        created_at_str, item_id_str = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_str), int(item_id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
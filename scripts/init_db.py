@@ -13,15 +13,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.database import Base, engine
 from app.models import *  # noqa: F401, F403
 
 
 async def init_database():
     """初始化数据库"""
-    settings = get_settings()
-
     print(f"Initializing database: {settings.DB_NAME}")
     print(f"Host: {settings.DB_HOST}:{settings.DB_PORT}")
 
@@ -11,21 +11,23 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import insert, select
+
 from app.core.database import AsyncSessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User
 from app.models.category import Category
 from app.models.tag import Tag
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task import Task, TaskStatus, TaskPriority, task_tags
 
 
 async def seed_data():
     """创建示例数据"""
     print("Seeding database with sample data...")
 
-    async with AsyncSessionLocal() as session:
+    # 整个种子写入在一个事务内完成，退出时统一提交
+    async with AsyncSessionLocal() as session, session.begin():
         # Check if data already exists
-        from sqlalchemy import select
         result = await session.execute(select(User).limit(1))
         if result.scalar_one_or_none():
             print("Data already exists. Skipping seed.")
@@ -50,13 +52,16 @@ async def seed_data():
             {"name": "Learning", "description": "Study and learning", "color": "#8B5CF6"},
         ]
 
-        categories = []
-        for cat_data in categories_data:
-            category = Category(user_id=demo_user.id, **cat_data)
-            session.add(category)
-            categories.append(category)
-        await session.flush()
-        print(f"Created {len(categories)} categories")
+        # 一条多行 INSERT 写入全部分类，再一次查询取回 ID
+        await session.execute(
+            insert(Category),
+            [{"user_id": demo_user.id, **cat_data} for cat_data in categories_data],
+        )
+        result = await session.execute(
+            select(Category.name, Category.id).where(Category.user_id == demo_user.id)
+        )
+        category_ids = dict(result.all())
+        print(f"Created {len(category_ids)} categories")
 
         # Create tags
         tags_data = [
@@ -67,13 +72,15 @@ async def seed_data():
             {"name": "meeting", "color": "#EC4899"},
         ]
 
-        tags = []
-        for tag_data in tags_data:
-            tag = Tag(user_id=demo_user.id, **tag_data)
-            session.add(tag)
-            tags.append(tag)
-        await session.flush()
-        print(f"Created {len(tags)} tags")
+        await session.execute(
+            insert(Tag),
+            [{"user_id": demo_user.id, **tag_data} for tag_data in tags_data],
+        )
+        result = await session.execute(
+            select(Tag.name, Tag.id).where(Tag.user_id == demo_user.id)
+        )
+        tag_ids = dict(result.all())
+        print(f"Created {len(tag_ids)} tags")
 
         # Create tasks
         tasks_data = [
@@ -82,8 +89,8 @@ async def seed_data():
                 "description": "Write comprehensive documentation for the API endpoints and setup instructions.",
                 "status": TaskStatus.IN_PROGRESS,
                 "priority": TaskPriority.HIGH,
-                "category": categories[0],
-                "tags": [tags[1], tags[3]],
+                "category": "Work",
+                "tags": ["important", "review"],
                 "due_date": datetime.now() + timedelta(days=3),
             },
             {
@@ -91,8 +98,8 @@ async def seed_data():
                 "description": "Review and merge pending pull requests from team members.",
                 "status": TaskStatus.PENDING,
                 "priority": TaskPriority.MEDIUM,
-                "category": categories[0],
-                "tags": [tags[3]],
+                "category": "Work",
+                "tags": ["review"],
                 "due_date": datetime.now() + timedelta(days=1),
             },
             {
@@ -100,8 +107,8 @@ async def seed_data():
                 "description": "Discuss project progress and upcoming milestones.",
                 "status": TaskStatus.PENDING,
                 "priority": TaskPriority.MEDIUM,
-                "category": categories[0],
-                "tags": [tags[4]],
+                "category": "Work",
+                "tags": ["meeting"],
                 "due_date": datetime.now() + timedelta(days=2),
             },
             {
@@ -109,8 +116,8 @@ async def seed_data():
                 "description": "Milk, eggs, bread, fruits, vegetables",
                 "status": TaskStatus.PENDING,
                 "priority": TaskPriority.LOW,
-                "category": categories[2],
-                "tags": [tags[2]],
+                "category": "Shopping",
+                "tags": ["easy"],
                 "due_date": datetime.now() + timedelta(days=1),
             },
             {
@@ -118,8 +125,8 @@ async def seed_data():
                 "description": "Study dependency injection, middleware, and background tasks.",
                 "status": TaskStatus.IN_PROGRESS,
                 "priority": TaskPriority.MEDIUM,
-                "category": categories[3],
-                "tags": [tags[1]],
+                "category": "Learning",
+                "tags": ["important"],
                 "due_date": datetime.now() + timedelta(days=7),
             },
             {
@@ -127,8 +134,8 @@ async def seed_data():
                 "description": "Users report that the login form sometimes doesn't submit.",
                 "status": TaskStatus.PENDING,
                 "priority": TaskPriority.URGENT,
-                "category": categories[0],
-                "tags": [tags[0], tags[1]],
+                "category": "Work",
+                "tags": ["urgent", "important"],
                 "due_date": datetime.now() + timedelta(hours=4),
             },
             {
@@ -136,7 +143,7 @@ async def seed_data():
                 "description": "30 minutes cardio + strength training",
                 "status": TaskStatus.COMPLETED,
                 "priority": TaskPriority.LOW,
-                "category": categories[1],
+                "category": "Personal",
                 "tags": [],
                 "due_date": datetime.now() - timedelta(days=1),
             },
@@ -145,24 +152,38 @@ async def seed_data():
                 "description": "Continue reading chapter 5-7",
                 "status": TaskStatus.IN_PROGRESS,
                 "priority": TaskPriority.LOW,
-                "category": categories[3],
+                "category": "Learning",
                 "tags": [],
                 "due_date": datetime.now() + timedelta(days=14),
             },
         ]
 
-        for task_data in tasks_data:
-            task_tags = task_data.pop("tags")
-            category = task_data.pop("category")
-            task = Task(
-                user_id=demo_user.id,
-                category_id=category.id,
-                **task_data
-            )
-            task.tags = task_tags
-            session.add(task)
-
-        await session.commit()
+        # 全部任务一条多行 INSERT 写入；演示用户是新建的，
+        # 按 ID 顺序取回即与插入顺序一致
+        task_tag_names = [task_data.pop("tags") for task_data in tasks_data]
+        await session.execute(
+            insert(Task),
+            [
+                {
+                    "user_id": demo_user.id,
+                    "category_id": category_ids[task_data.pop("category")],
+                    **task_data,
+                }
+                for task_data in tasks_data
+            ],
+        )
+        result = await session.execute(
+            select(Task.id).where(Task.user_id == demo_user.id).order_by(Task.id)
+        )
+        task_ids = result.scalars().all()
+
+        # 标签关联用一条多行 INSERT 写入关联表
+        task_tag_rows = [
+            {"task_id": task_id, "tag_id": tag_ids[name]}
+            for task_id, names in zip(task_ids, task_tag_names)
+            for name in names
+        ]
+        await session.execute(insert(task_tags), task_tag_rows)
         print(f"Created {len(tasks_data)} tasks")
 
     print("\nSeed data created successfully!")
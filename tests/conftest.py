@@ -3,40 +3,80 @@
 定义 pytest fixtures 和测试数据库设置
 """
 import asyncio
-from typing import AsyncGenerator, Generator
+from functools import lru_cache
+from typing import AsyncGenerator, Awaitable, Callable, Generator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from app.core.config import get_settings
+from app.core import security
+from app.core.cache import clear_caches
 from app.core.database import Base, get_db
-from app.core.security import create_access_token, get_password_hash
+from app.core.security import create_access_token
 from app.main import app
+from app.models.task import Task
 from app.models.user import User
 
-settings = get_settings()
-
 # 测试数据库 URL（使用 SQLite 内存数据库进行测试）
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# test_user 的密码 "testpassword123" 预先计算的 bcrypt 哈希（4 轮），
+# 创建用户时不再现场哈希；登录测试仍以真实 bcrypt 校验
+TEST_USER_PASSWORD_HASH = "$2b$04$IvBjt0TIj13M.GW.7sS4.eN4HCOSPTOfDe4IlPuZ/Nzqc1hH3O0W."
+
 # 创建测试数据库引擎
+# 内存库只存在于创建它的连接中，StaticPool 保证所有会话共用这一个连接
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
+    poolclass=StaticPool,
 )
 
 # 测试会话工厂
+# 会话绑定到每个测试的外层事务所在连接，commit 只释放 SAVEPOINT
 TestSessionLocal = async_sessionmaker(
-    bind=test_engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
+    join_transaction_mode="create_savepoint",
 )
 
 
+@event.listens_for(test_engine.sync_engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    初始化测试库连接
+
+    关闭 sqlite3 驱动的隐式事务管理，否则 SAVEPOINT 无法嵌套在外层事务中；
+    测试库用完即弃，关闭持久化相关开销，并像 MySQL 一样强制外键约束
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    """由 SQLAlchemy 显式发出 BEGIN"""
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """注册自定义标记"""
+    config.addinivalue_line(
+        "markers", "real_bcrypt: 使用生产环境的 bcrypt 计算成本"
+    )
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """创建事件循环"""
@@ -45,44 +85,103 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+@pytest.fixture(autouse=True)
+def reset_caches() -> Generator:
     """
-    创建测试数据库会话
+    清空进程内缓存
 
-    每个测试函数使用独立的数据库会话，测试后自动清理
+    每个测试的数据都会回滚，避免缓存的用户/Token 跨测试泄漏
+    """
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    降低测试中的 bcrypt 计算成本
+
+    bcrypt 12 轮每次约 100ms，测试用户创建、注册和登录都要哈希或校验密码。
+    改为最低的 4 轮，生成的仍是真实 bcrypt 哈希，校验逻辑不变；
+    需要验证生产成本的测试加 @pytest.mark.real_bcrypt
+    """
+    if request.node.get_closest_marker("real_bcrypt") is None:
+        monkeypatch.setattr(security, "BCRYPT_ROUNDS", 4)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def database_schema() -> AsyncGenerator[None, None]:
+    """
+    整个测试会话只建表一次
+
+    各测试的数据隔离由 db_session 的事务回滚保证
     """
-    # 创建所有表
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with TestSessionLocal() as session:
-        yield session
+    yield
 
-    # 删除所有表
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def db_session(database_schema: None) -> AsyncGenerator[AsyncSession, None]:
     """
-    创建测试 HTTP 客户端
+    创建测试数据库会话
 
-    自动替换数据库依赖为测试数据库
+    每个测试在一个外层事务中运行，会话内的 commit 只释放 SAVEPOINT，
+    测试结束后回滚外层事务，数据不会泄漏到其他测试
     """
-    async def override_get_db():
-        yield db_session
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        async with TestSessionLocal(bind=conn) as session:
+            yield session
+        await trans.rollback()
 
-    app.dependency_overrides[get_db] = override_get_db
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    整个测试会话共用的 HTTP 客户端
+
+    ASGITransport 不持有连接，客户端只需创建一次
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as ac:
         yield ac
 
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    创建测试 HTTP 客户端
+
+    复用会话级客户端，每个测试只替换数据库依赖为当前测试的会话
+    """
+    async def override_get_db():
+        # 与 get_db 一致，每个请求是一个事务边界。会话以 SAVEPOINT 加入
+        # 外层事务，commit 只释放 SAVEPOINT；请求失败时只回滚本次请求的写入，
+        # 之前请求的数据保留，测试结束时随外层事务一起回滚
+        try:
+            yield db_session
+            await db_session.commit()
+        except Exception:
+            await db_session.rollback()
+            raise
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    yield http_client
+
     app.dependency_overrides.clear()
+    http_client.cookies.clear()
 
 
 @pytest_asyncio.fixture
@@ -95,7 +194,7 @@ async def test_user(db_session: AsyncSession) -> User:
     user = User(
         username="testuser",
         email="test@example.com",
-        hashed_password=get_password_hash("testpassword123"),
+        hashed_password=TEST_USER_PASSWORD_HASH,
         is_active=True,
     )
     db_session.add(user)
@@ -104,6 +203,36 @@ async def test_user(db_session: AsyncSession) -> User:
     return user
 
 
+@pytest.fixture
+def make_tasks(
+    db_session: AsyncSession, test_user: User
+) -> Callable[[int], Awaitable[None]]:
+    """
+    批量插入测试任务
+
+    直接用一条 INSERT 写入数据库，标题依次为 "Task 0"、"Task 1"...，
+    供只需要已有数据的列表类测试使用
+    """
+    async def _make_tasks(count: int) -> None:
+        await db_session.execute(
+            insert(Task),
+            [{"user_id": test_user.id, "title": f"Task {i}"} for i in range(count)],
+        )
+        await db_session.commit()
+
+    return _make_tasks
+
+
+@lru_cache(maxsize=None)
+def _access_token(user_id: int) -> str:
+    """
+    同一用户 ID 在整个测试会话中复用一个 Token
+
+    每个测试回滚后重新创建的 test_user 会得到相同的 ID
+    """
+    return create_access_token(data={"sub": str(user_id)})
+
+
 @pytest.fixture
 def auth_headers(test_user: User) -> dict:
     """
@@ -111,8 +240,7 @@ def auth_headers(test_user: User) -> dict:
 
     包含测试用户的 JWT Token
     """
-    token = create_access_token(data={"sub": str(test_user.id)})
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {_access_token(test_user.id)}"}
 
 
 @pytest.fixture
@@ -22,43 +22,52 @@ class TestAuthAPI:
         assert "hashed_password" not in data
 
     @pytest.mark.asyncio
-    async def test_register_duplicate_email(
-        self, client: AsyncClient, test_user: dict, test_user_data: dict
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("email", "test@example.com"),
+            ("username", "testuser"),
+        ],
+    )
+    async def test_register_duplicate(
+        self,
+        client: AsyncClient,
+        test_user: dict,
+        test_user_data: dict,
+        field: str,
+        value: str,
     ):
-        """测试重复邮箱注册"""
-        # 使用已存在的邮箱
-        test_user_data["email"] = "test@example.com"
+        """测试重复邮箱或用户名注册"""
+        # 使用已存在用户的邮箱或用户名
+        test_user_data[field] = value
 
         response = await client.post("/api/v1/auth/register", json=test_user_data)
 
         assert response.status_code == 400
-        assert "email" in response.json()["detail"].lower()
+        assert field in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
-    async def test_register_invalid_email(self, client: AsyncClient):
-        """测试无效邮箱注册"""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            # 无效邮箱
+            {
                 "username": "testuser",
                 "email": "invalid-email",
                 "password": "password123",
             },
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_register_short_password(self, client: AsyncClient):
-        """测试密码太短"""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
+            # 密码太短
+            {
                 "username": "testuser",
                 "email": "test@example.com",
                 "password": "123",
             },
-        )
+        ],
+        ids=["invalid_email", "short_password"],
+    )
+    async def test_register_invalid_payload(self, client: AsyncClient, payload: dict):
+        """测试注册参数校验失败"""
+        response = await client.post("/api/v1/auth/register", json=payload)
 
         assert response.status_code == 422
 
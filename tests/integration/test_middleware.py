@@ -0,0 +1,103 @@
+"""
+中间件集成测试
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.exceptions import NotFoundException
+from app.core.middleware import AppExceptionMiddleware
+
+
+def _raising_app(exc: Exception):
+    """构造一个直接抛出指定异常的 ASGI 应用"""
+
+    async def app(scope, receive, send):
+        raise exc
+
+    return app
+
+
+class TestCORS:
+    """CORS 中间件测试类"""
+
+    @pytest.mark.asyncio
+    async def test_preflight(self, client: AsyncClient):
+        """测试预检请求直接返回允许的来源、方法和请求头"""
+        response = await client.options(
+            "/api/v1/tasks",
+            headers={
+                "Origin": "http://example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, content-type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert (
+            response.headers["access-control-allow-headers"]
+            == "authorization, content-type"
+        )
+
+    @pytest.mark.asyncio
+    async def test_simple_request(self, client: AsyncClient):
+        """测试跨域简单请求附加 CORS 响应头"""
+        response = await client.get(
+            "/health", headers={"Origin": "http://example.com"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+        assert response.headers["vary"] == "Origin"
+
+    @pytest.mark.asyncio
+    async def test_same_origin_request(self, client: AsyncClient):
+        """测试无 Origin 的请求不附加 CORS 响应头"""
+        response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestAppExceptionMiddleware:
+    """全局异常处理中间件测试类"""
+
+    @pytest.mark.asyncio
+    async def test_app_exception(self):
+        """测试业务异常转换为对应状态码的 JSON 响应"""
+        app = AppExceptionMiddleware(_raising_app(NotFoundException("Task not found")))
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as ac:
+            response = await ac.get("/")
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"detail": "Task not found"}
+
+    @pytest.mark.asyncio
+    async def test_unhandled_exception(self):
+        """测试未处理异常返回 500，异常信息中的花括号不影响日志格式化"""
+        app = AppExceptionMiddleware(_raising_app(KeyError("{missing}")))
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as ac:
+            response = await ac.get("/")
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+
+    @pytest.mark.asyncio
+    async def test_error_response_has_cors_headers(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """测试业务异常响应同样附加 CORS 响应头"""
+        response = await client.get(
+            "/api/v1/tasks/999999",
+            headers={**auth_headers, "Origin": "http://example.com"},
+        )
+
+        assert response.status_code == 404
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
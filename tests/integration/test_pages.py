@@ -0,0 +1,69 @@
+"""
+Web 页面集成测试
+"""
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+class TestPages:
+    """Web 页面路由测试类"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path",
+        ["/", "/login", "/register", "/tasks", "/categories", "/tags", "/profile"],
+    )
+    async def test_page_renders(self, client: AsyncClient, path: str):
+        """测试页面返回预渲染的 HTML"""
+        response = await client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "<html" in response.text
+
+    @pytest.mark.asyncio
+    async def test_index_contains_app_name(self, client: AsyncClient):
+        """测试首页包含应用名称"""
+        response = await client.get("/")
+
+        assert settings.APP_NAME in response.text
+
+
+class TestStaticFiles:
+    """静态文件测试类"""
+
+    @pytest.mark.asyncio
+    async def test_cache_headers(self, client: AsyncClient):
+        """测试静态文件附加缓存头"""
+        response = await client.get("/static/css/style.css")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert "etag" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_fingerprinted_url_is_immutable(self, client: AsyncClient):
+        """测试页面引用带内容指纹的资源 URL，且该 URL 长期缓存"""
+        page = await client.get("/")
+        match = re.search(r'href="(/static/css/style\.css\?v=[0-9a-f]+)"', page.text)
+        assert match is not None
+
+        response = await client.get(match.group(1))
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=604800, immutable"
+
+    @pytest.mark.asyncio
+    async def test_not_modified(self, client: AsyncClient):
+        """测试 ETag 协商缓存命中时返回 304 并保留缓存头"""
+        first = await client.get("/static/js/main.js")
+        response = await client.get(
+            "/static/js/main.js", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "public, max-age=60"
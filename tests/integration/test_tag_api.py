@@ -0,0 +1,81 @@
+"""
+标签与分类 API 集成测试
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestTagAPI:
+    """标签与分类 API 测试类"""
+
+    @pytest.mark.asyncio
+    async def test_create_tag_duplicate_name(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """测试重复标签名称由唯一约束拦截"""
+        payload = {"name": "urgent", "color": "#FF0000"}
+        first = await client.post("/api/v1/tags", json=payload, headers=auth_headers)
+        assert first.status_code == 201
+
+        response = await client.post(
+            "/api/v1/tags", json=payload, headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert "already exists" in response.json()["detail"]
+
+        # 失败请求的回滚不影响之前请求写入的标签
+        listed = await client.get("/api/v1/tags", headers=auth_headers)
+        assert [tag["name"] for tag in listed.json()] == ["urgent"]
+
+    @pytest.mark.asyncio
+    async def test_create_category_duplicate_name(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """测试重复分类名称由唯一约束拦截"""
+        payload = {"name": "Work"}
+        first = await client.post(
+            "/api/v1/categories", json=payload, headers=auth_headers
+        )
+        assert first.status_code == 201
+
+        response = await client.post(
+            "/api/v1/categories", json=payload, headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert "already exists" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_update_tag_unchanged_skips_write(
+        self, client: AsyncClient, auth_headers: dict, db_session: AsyncSession
+    ):
+        """测试回传未修改的标签时只查询一次，不做 flush/refresh"""
+        payload = {"name": "urgent", "color": "#FF0000"}
+        created = await client.post(
+            "/api/v1/tags", json=payload, headers=auth_headers
+        )
+        tag_id = created.json()["id"]
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.put(
+                f"/api/v1/tags/{tag_id}", json=payload, headers=auth_headers
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "urgent"
+        # 仅归属校验的 SELECT，没有 UPDATE 和 refresh
+        tag_statements = [s for s in statements if "tags" in s]
+        assert len(tag_statements) == 1
+        assert tag_statements[0].lstrip().upper().startswith("SELECT")
@@ -0,0 +1,103 @@
+"""
+任务 Repository 集成测试
+"""
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category import Category
+from app.models.tag import Tag
+from app.models.task import Task, TaskStatus, task_tags
+from app.models.user import User
+from app.repositories.task_repository import TaskRepository
+
+
+class TestTaskRepository:
+    """任务 Repository 测试类"""
+
+    @pytest.mark.asyncio
+    async def test_list_eager_loads_relations(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """测试任务列表预加载分类和标签，不产生 N+1 查询"""
+        category = Category(name="Work", user_id=test_user.id)
+        tag = Tag(name="urgent", user_id=test_user.id)
+        db_session.add_all([category, tag])
+        await db_session.flush()
+        for i in range(10):
+            db_session.add(Task(
+                title=f"Task {i}",
+                user_id=test_user.id,
+                category_id=category.id,
+                tags=[tag],
+            ))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            # 测试夹具的 SAVEPOINT 不计入
+            if not statement.startswith("SAVEPOINT"):
+                statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            tasks = await TaskRepository(db_session).get_user_tasks(
+                test_user.id, limit=5
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+        assert len(tasks) == 5
+        assert all(t.category.name == "Work" for t in tasks)
+        assert all([tg.name for tg in t.tags] == ["urgent"] for t in tasks)
+        # 任务（JOIN 分类）+ 标签，共两条查询
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_user_task_cascades_tags(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """测试删除任务时由外键级联清理标签关联"""
+        tag = Tag(name="urgent", user_id=test_user.id)
+        task = Task(title="Task", user_id=test_user.id, tags=[tag])
+        db_session.add(task)
+        await db_session.flush()
+
+        repo = TaskRepository(db_session)
+        assert await repo.delete_user_task(task.id, test_user.id)
+
+        result = await db_session.execute(
+            select(func.count()).select_from(task_tags)
+        )
+        assert result.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_count_by_status_single_query(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """测试状态统计由一条 GROUP BY 查询完成"""
+        db_session.add_all([
+            Task(title="A", user_id=test_user.id, status=TaskStatus.PENDING),
+            Task(title="B", user_id=test_user.id, status=TaskStatus.PENDING),
+            Task(title="C", user_id=test_user.id, status=TaskStatus.COMPLETED),
+        ])
+        await db_session.flush()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            counts = await TaskRepository(db_session).count_by_status(test_user.id)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+        assert counts == {"pending": 2, "completed": 1}
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
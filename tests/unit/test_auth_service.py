@@ -1,11 +1,13 @@
 """
 认证服务单元测试
 """
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import BadRequestException, UnauthorizedException
-from app.models.user import User
 from app.schemas.user import UserCreate
 from app.services.auth_service import AuthService
 
@@ -25,13 +27,13 @@ class TestAuthService:
 
     @pytest.fixture
     def sample_user(self):
-        user = MagicMock(spec=User)
-        user.id = 1
-        user.username = "testuser"
-        user.email = "test@example.com"
-        user.hashed_password = "$2b$12$test_hash"
-        user.is_active = True
-        return user
+        return SimpleNamespace(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            hashed_password="$2b$12$test_hash",
+            is_active=True,
+        )
 
     @pytest.mark.asyncio
     async def test_register_success(self, auth_service, sample_user):
@@ -42,8 +44,7 @@ class TestAuthService:
             email="new@example.com",
             password="password123",
         )
-        auth_service.user_repo.email_exists.return_value = False
-        auth_service.user_repo.username_exists.return_value = False
+        auth_service.user_repo.email_or_username_taken.return_value = None
         auth_service.user_repo.create.return_value = sample_user
 
         # Act
@@ -62,7 +63,7 @@ class TestAuthService:
             email="existing@example.com",
             password="password123",
         )
-        auth_service.user_repo.email_exists.return_value = True
+        auth_service.user_repo.email_or_username_taken.return_value = "email"
 
         # Act & Assert
         with pytest.raises(BadRequestException) as exc_info:
@@ -79,8 +80,7 @@ class TestAuthService:
             email="new@example.com",
             password="password123",
         )
-        auth_service.user_repo.email_exists.return_value = False
-        auth_service.user_repo.username_exists.return_value = True
+        auth_service.user_repo.email_or_username_taken.return_value = "username"
 
         # Act & Assert
         with pytest.raises(BadRequestException) as exc_info:
@@ -88,6 +88,26 @@ class TestAuthService:
 
         assert "username" in str(exc_info.value.message).lower()
 
+    @pytest.mark.asyncio
+    async def test_register_race_integrity_error(self, auth_service):
+        """测试并发注册时由唯一索引兜底"""
+        # Arrange
+        user_in = UserCreate(
+            username="newuser",
+            email="new@example.com",
+            password="password123",
+        )
+        auth_service.user_repo.email_or_username_taken.return_value = None
+        auth_service.user_repo.create.side_effect = IntegrityError(
+            "INSERT", {}, Exception("duplicate")
+        )
+
+        # Act & Assert
+        with pytest.raises(BadRequestException):
+            await auth_service.register(user_in)
+
+        auth_service.db.rollback.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_login_success(self, auth_service, sample_user, monkeypatch):
         """测试成功登录"""
@@ -96,8 +116,8 @@ class TestAuthService:
 
         # Mock password verification
         monkeypatch.setattr(
-            "app.services.auth_service.verify_password",
-            lambda p, h: True
+            "app.services.auth_service.verify_password_async",
+            AsyncMock(return_value=True),
         )
 
         # Act
@@ -108,23 +128,39 @@ class TestAuthService:
         assert result.token_type == "bearer"
 
     @pytest.mark.asyncio
-    async def test_login_user_not_found(self, auth_service):
-        """测试用户不存在"""
+    async def test_login_user_not_found(self, auth_service, monkeypatch):
+        """测试用户不存在时仍执行一次占位密码校验"""
         # Arrange
         auth_service.user_repo.get_by_email.return_value = None
+        dummy_verify = AsyncMock(return_value=False)
+        monkeypatch.setattr(
+            "app.services.auth_service.verify_dummy_password_async",
+            dummy_verify,
+        )
 
         # Act & Assert
         with pytest.raises(UnauthorizedException):
             await auth_service.login("unknown@example.com", "password")
 
+        dummy_verify.assert_awaited_once_with("password")
+
+    @pytest.mark.asyncio
+    async def test_login_empty_password(self, auth_service):
+        """测试空密码直接失败，不查询数据库"""
+        # Act & Assert
+        with pytest.raises(UnauthorizedException):
+            await auth_service.login("test@example.com", "")
+
+        auth_service.user_repo.get_by_email.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_login_wrong_password(self, auth_service, sample_user, monkeypatch):
         """测试密码错误"""
         # Arrange
         auth_service.user_repo.get_by_email.return_value = sample_user
         monkeypatch.setattr(
-            "app.services.auth_service.verify_password",
-            lambda p, h: False
+            "app.services.auth_service.verify_password_async",
+            AsyncMock(return_value=False),
         )
 
         # Act & Assert
@@ -138,8 +174,8 @@ class TestAuthService:
         sample_user.is_active = False
         auth_service.user_repo.get_by_email.return_value = sample_user
         monkeypatch.setattr(
-            "app.services.auth_service.verify_password",
-            lambda p, h: True
+            "app.services.auth_service.verify_password_async",
+            AsyncMock(return_value=True),
         )
 
         # Act & Assert
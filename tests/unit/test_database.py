@@ -0,0 +1,106 @@
+"""
+数据库会话依赖单元测试
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+
+
+class TestGetDb:
+    """get_db 事务提交测试类"""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        session.close = AsyncMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        monkeypatch.setattr(database, "AsyncSessionLocal", lambda: session)
+        return session
+
+    async def _run(self, method: str) -> None:
+        gen = database.get_db(SimpleNamespace(method=method))
+        await gen.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["GET", "HEAD", "OPTIONS"])
+    async def test_safe_method_skips_commit(self, session, method):
+        """测试只读请求不提交事务"""
+        await self._run(method)
+
+        session.commit.assert_not_awaited()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+    async def test_write_method_commits(self, session, method):
+        """测试写请求成功后提交事务"""
+        await self._run(method)
+
+        session.commit.assert_awaited_once()
+
+
+class TestQueryProfiling:
+    """慢查询检测测试类"""
+
+    @pytest.mark.asyncio
+    async def test_slow_select_logs_plan(self, monkeypatch):
+        """测试超过阈值的 SELECT 记录接口和执行计划"""
+        monkeypatch.setattr(database.settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        database.enable_query_profiling(engine)
+
+        messages = []
+        sink_id = logger.add(messages.append, level="WARNING", format="{message}")
+        token = database.query_endpoint.set("GET /api/v1/tasks")
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+                await conn.execute(text("SELECT id FROM t WHERE id = :id"), {"id": 1})
+        finally:
+            database.query_endpoint.reset(token)
+            logger.remove(sink_id)
+            await engine.dispose()
+
+        assert len(messages) == 1
+        record = json.loads(messages[0].split("Slow query: ", 1)[1])
+        assert record["endpoint"] == "GET /api/v1/tasks"
+        assert record["statement"].startswith("SELECT id FROM t")
+        assert isinstance(record["plan"], list)
+
+
+class TestWarmupPool:
+    """连接池预热测试类"""
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_closes_opened_connections(self, monkeypatch):
+        """测试部分连接失败时，已建立的连接全部归还后再抛出异常"""
+        opened = [AsyncMock(), AsyncMock()]
+        outcomes = [opened[0], ConnectionError("refused"), opened[1]]
+
+        async def connect():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(database, "_is_sqlite", False)
+        monkeypatch.setattr(database.settings, "DB_POOL_SIZE", 3)
+        monkeypatch.setattr(database, "engine", SimpleNamespace(connect=connect))
+
+        with pytest.raises(ConnectionError):
+            await database.warmup_pool()
+
+        for conn in opened:
+            conn.close.assert_awaited_once()
@@ -0,0 +1,163 @@
+"""
+依赖注入单元测试
+"""
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import text
+
+from app.api import deps
+from app.core.cache import (
+    cache_user,
+    clear_caches,
+    invalidate_user,
+    invalidate_user_after_commit,
+    token_cache,
+    user_cache,
+)
+from app.core.security import create_access_token
+
+
+class TestTokenCache:
+    """Token 解码缓存测试类"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+
+    def test_cache_hit_skips_decode(self, monkeypatch):
+        """测试缓存命中时不再解码 Token"""
+        token = create_access_token(data={"sub": "42"})
+        assert deps._get_token_user_id(token) == 42
+
+        def fail_decode(token):
+            raise AssertionError("decode_access_token should not be called")
+
+        monkeypatch.setattr(deps, "decode_access_token", fail_decode)
+
+        assert deps._get_token_user_id(token) == 42
+
+    def test_expired_cache_entry_rejected(self):
+        """测试缓存中已过期的 Token 被拒绝"""
+        token_cache["expired-token"] = (42, time.time() - 1)
+
+        assert deps._get_token_user_id("expired-token") is None
+        assert "expired-token" not in token_cache
+
+    def test_invalid_token_not_cached(self):
+        """测试无效 Token 不写入缓存"""
+        assert deps._get_token_user_id("not-a-jwt") is None
+        assert "not-a-jwt" not in token_cache
+
+
+class TestCurrentUserCache:
+    """当前用户快照缓存测试类"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        clear_caches()
+        yield
+        clear_caches()
+
+    @pytest.fixture
+    def credentials(self):
+        token = create_access_token(data={"sub": "7"})
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    @pytest.fixture
+    def cached_user(self):
+        now = datetime.utcnow()
+        return cache_user({
+            "id": 7,
+            "username": "cached",
+            "email": "cached@example.com",
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        })
+
+    @pytest.mark.asyncio
+    async def test_cached_user_skips_db(self, credentials, cached_user):
+        """测试缓存命中时不查询数据库"""
+        db = AsyncMock()
+
+        user = await deps.get_current_user(credentials=credentials, db=db)
+
+        assert user.id == 7
+        assert user.username == "cached"
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_user_reloaded(self, credentials, cached_user):
+        """测试缓存失效后重新查询数据库"""
+        invalidate_user(7)
+        db = AsyncMock()
+        result = MagicMock()
+        result.mappings.return_value.one_or_none.return_value = None
+        db.execute.return_value = result
+
+        with pytest.raises(HTTPException):
+            await deps.get_current_user(credentials=credentials, db=db)
+
+        db.execute.assert_called_once()
+
+
+class TestCredentialsPrecheck:
+    """凭证预检查测试类"""
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials(self):
+        """测试缺失凭证返回 401"""
+        with pytest.raises(HTTPException) as exc_info:
+            await deps.get_current_user(credentials=None, db=AsyncMock())
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_malformed_token_skips_decode(self, monkeypatch):
+        """测试格式错误的 Token 不解码、不查库"""
+        def fail_decode(token):
+            raise AssertionError("decode_access_token should not be called")
+
+        monkeypatch.setattr(deps, "decode_access_token", fail_decode)
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials="not-a-jwt"
+        )
+        db = AsyncMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await deps.get_current_user(credentials=credentials, db=db)
+
+        assert exc_info.value.status_code == 401
+        db.execute.assert_not_called()
+
+
+class TestUserCacheInvalidation:
+    """用户快照缓存提交后失效测试类"""
+
+    @pytest.mark.asyncio
+    async def test_invalidated_after_commit(self, db_session):
+        """测试提交之后才使用户快照失效"""
+        user_cache[7] = {"id": 7}
+        invalidate_user_after_commit(db_session, 7)
+
+        assert 7 in user_cache
+        await db_session.commit()
+        assert 7 not in user_cache
+
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_snapshot(self, db_session):
+        """测试回滚时丢弃待失效记录，快照保留"""
+        user_cache[7] = {"id": 7}
+        await db_session.execute(text("SELECT 1"))
+        invalidate_user_after_commit(db_session, 7)
+
+        await db_session.rollback()
+        await db_session.commit()
+        assert 7 in user_cache
@@ -0,0 +1,118 @@
+"""
+安全模块单元测试
+"""
+from datetime import timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from app.core import security
+from app.core.security import (
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    get_password_hash_async,
+    verify_dummy_password_async,
+    verify_password,
+    verify_password_async,
+)
+
+
+def _ed25519_pem() -> str:
+    """生成测试用的 Ed25519 私钥 PEM"""
+    return Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+
+
+class TestPasswordHashing:
+    """密码哈希测试类"""
+
+    @pytest.mark.real_bcrypt
+    def test_hash_and_verify(self):
+        """测试哈希后可以正确校验"""
+        hashed = get_password_hash("password123")
+
+        assert hashed.startswith("$2b$12$")
+        assert verify_password("password123", hashed)
+        assert not verify_password("wrongpassword", hashed)
+
+    def test_verify_invalid_hash(self):
+        """测试无效哈希返回 False"""
+        assert not verify_password("password123", "not-a-bcrypt-hash")
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """测试线程池版本的哈希与校验"""
+        hashed = await get_password_hash_async("password123")
+
+        assert await verify_password_async("password123", hashed)
+        assert not await verify_password_async("wrongpassword", hashed)
+
+    @pytest.mark.asyncio
+    async def test_dummy_verify_always_fails(self):
+        """测试占位校验恒为 False 且复用同一个哈希"""
+        assert not await verify_dummy_password_async("password123")
+        assert not await verify_dummy_password_async("")
+        assert security._dummy_password_hash.cache_info().currsize == 1
+
+
+class TestAccessToken:
+    """JWT 令牌测试类"""
+
+    def test_encode_and_decode(self):
+        """测试签发的令牌可以正确解码"""
+        token = create_access_token(data={"sub": "1"})
+        payload = decode_access_token(token)
+
+        assert payload["sub"] == "1"
+        assert "exp" in payload
+
+    def test_decode_tampered_token(self):
+        """测试签名被篡改的令牌返回 None"""
+        token = create_access_token(data={"sub": "1"})
+        header, body, signature = token.split(".")
+        tampered = ".".join([header, body, signature[::-1]])
+
+        assert decode_access_token(tampered) is None
+
+    def test_decode_expired_token(self):
+        """测试过期令牌返回 None"""
+        token = create_access_token(
+            data={"sub": "1"}, expires_delta=timedelta(seconds=-1)
+        )
+
+        assert decode_access_token(token) is None
+
+    def test_eddsa_keys(self, monkeypatch):
+        """测试配置 Ed25519 PEM 密钥时使用 EdDSA 签发和验证"""
+        monkeypatch.setattr(security.settings, "JWT_PRIVATE_KEY_PEM", _ed25519_pem())
+        monkeypatch.setattr(security.settings, "ALGORITHM", "EdDSA")
+        signing_key, verifying_key = security._load_jwt_keys()
+        monkeypatch.setattr(security, "_JWT_SIGNING_KEY", signing_key)
+        monkeypatch.setattr(security, "_JWT_VERIFYING_KEY", verifying_key)
+        monkeypatch.setattr(security, "_JWT_ALGORITHM", "EdDSA")
+        monkeypatch.setattr(security, "_JWT_ALGORITHMS", ["EdDSA"])
+
+        token = create_access_token(data={"sub": "1"})
+
+        assert decode_access_token(token)["sub"] == "1"
+
+    def test_asymmetric_algorithm_without_pem(self, monkeypatch):
+        """测试非对称算法未配置 PEM 密钥时启动即报错"""
+        monkeypatch.setattr(security.settings, "JWT_PRIVATE_KEY_PEM", None)
+        monkeypatch.setattr(security.settings, "ALGORITHM", "EdDSA")
+
+        with pytest.raises(ValueError, match="JWT_PRIVATE_KEY_PEM"):
+            security._load_jwt_keys()
+
+    def test_symmetric_algorithm_with_pem(self, monkeypatch):
+        """测试 HS* 算法配置了 PEM 密钥时启动即报错"""
+        monkeypatch.setattr(security.settings, "JWT_PRIVATE_KEY_PEM", _ed25519_pem())
+        monkeypatch.setattr(security.settings, "ALGORITHM", "HS256")
+
+        with pytest.raises(ValueError, match="HS256"):
+            security._load_jwt_keys()
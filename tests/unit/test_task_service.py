@@ -1,11 +1,13 @@
 """
 任务服务单元测试
 """
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from app.core.exceptions import ForbiddenException, NotFoundException
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task import TaskStatus, TaskPriority
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.services.task_service import TaskService
 
@@ -23,22 +25,23 @@ class TestTaskService:
         """创建带模拟依赖的任务服务"""
         service = TaskService(mock_db)
         service.task_repo = AsyncMock()
+        service.task_repo.load_relations.side_effect = lambda task: task
         service.tag_repo = AsyncMock()
         return service
 
     @pytest.fixture
     def sample_task(self):
         """创建示例任务"""
-        task = MagicMock(spec=Task)
-        task.id = 1
-        task.title = "Test Task"
-        task.description = "Test Description"
-        task.status = TaskStatus.PENDING
-        task.priority = TaskPriority.MEDIUM
-        task.user_id = 1
-        task.category_id = None
-        task.tags = []
-        return task
+        return SimpleNamespace(
+            id=1,
+            title="Test Task",
+            description="Test Description",
+            status=TaskStatus.PENDING,
+            priority=TaskPriority.MEDIUM,
+            user_id=1,
+            category_id=None,
+            tags=[],
+        )
 
     @pytest.mark.asyncio
     async def test_create_task_success(self, task_service, sample_task):
@@ -69,18 +72,17 @@ class TestTaskService:
             tag_ids=[1, 2, 3],
         )
         task_service.task_repo.create.return_value = sample_task
-        task_service.tag_repo.get_by_ids.return_value = [
-            MagicMock(id=1),
-            MagicMock(id=2),
-        ]
+        task_service.tag_repo.get_valid_tag_ids.return_value = {1, 2}
         task_service.task_repo.update_task_tags.return_value = sample_task
 
         # Act
         result = await task_service.create_task(user_id, task_in)
 
         # Assert
-        task_service.tag_repo.get_by_ids.assert_called_once()
-        task_service.task_repo.update_task_tags.assert_called_once()
+        task_service.tag_repo.get_valid_tag_ids.assert_called_once_with(1, [1, 2, 3])
+        task_service.task_repo.update_task_tags.assert_called_once_with(
+            sample_task, [1, 2]
+        )
 
     @pytest.mark.asyncio
     async def test_get_task_success(self, task_service, sample_task):
@@ -132,27 +134,64 @@ class TestTaskService:
         # Assert
         task_service.task_repo.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_task_tags_only(self, task_service, sample_task):
+        """测试只更新标签时不更新任务字段"""
+        # Arrange
+        task_service.task_repo.get_task_with_relations.return_value = sample_task
+        task_service.tag_repo.get_valid_tag_ids.return_value = {2}
+        task_service.task_repo.update_task_tags.return_value = sample_task
+        task_in = TaskUpdate(tag_ids=[2])
+
+        # Act
+        await task_service.update_task(1, user_id=1, task_in=task_in)
+
+        # Assert
+        task_service.task_repo.update.assert_not_called()
+        task_service.tag_repo.get_valid_tag_ids.assert_called_once_with(1, [2])
+        task_service.task_repo.update_task_tags.assert_called_once_with(
+            sample_task, [2]
+        )
+
     @pytest.mark.asyncio
     async def test_delete_task_success(self, task_service, sample_task):
         """测试成功删除任务"""
         # Arrange
-        task_service.task_repo.get_task_with_relations.return_value = sample_task
-        task_service.task_repo.delete.return_value = True
+        task_service.task_repo.delete_user_task.return_value = True
 
         # Act
         result = await task_service.delete_task(1, user_id=1)
 
         # Assert
         assert result is True
-        task_service.task_repo.delete.assert_called_once_with(1)
+        task_service.task_repo.delete_user_task.assert_called_once_with(1, 1)
+        task_service.task_repo.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_task_forbidden(self, task_service):
+        """测试删除他人任务"""
+        task_service.task_repo.delete_user_task.return_value = False
+        task_service.task_repo.exists.return_value = True
+
+        with pytest.raises(ForbiddenException):
+            await task_service.delete_task(1, user_id=2)
+
+    @pytest.mark.asyncio
+    async def test_delete_task_not_found(self, task_service):
+        """测试删除不存在的任务"""
+        task_service.task_repo.delete_user_task.return_value = False
+        task_service.task_repo.exists.return_value = False
+
+        with pytest.raises(NotFoundException):
+            await task_service.delete_task(999, user_id=1)
 
     @pytest.mark.asyncio
     async def test_change_status(self, task_service, sample_task):
         """测试更改任务状态"""
         # Arrange
-        task_service.task_repo.get_task_with_relations.return_value = sample_task
+        task_service.task_repo.update_status_owned.return_value = 1
         sample_task.status = TaskStatus.COMPLETED
-        task_service.task_repo.update.return_value = sample_task
+        task_service.task_repo.get_task_with_relations.return_value = sample_task
 
         # Act
         result = await task_service.change_status(
@@ -160,16 +199,56 @@ class TestTaskService:
         )
 
         # Assert
-        task_service.task_repo.update.assert_called_once()
+        assert result.status == TaskStatus.COMPLETED
+        task_service.task_repo.update_status_owned.assert_called_once_with(
+            1, 1, TaskStatus.COMPLETED
+        )
+        task_service.task_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_change_status_forbidden(self, task_service, sample_task):
+        """测试更改他人任务状态被拒绝"""
+        # Arrange
+        task_service.task_repo.update_status_owned.return_value = 0
+        sample_task.user_id = 2
+        task_service.task_repo.get_task_with_relations.return_value = sample_task
+
+        # Act & Assert
+        with pytest.raises(ForbiddenException):
+            await task_service.change_status(
+                1, user_id=1, new_status=TaskStatus.COMPLETED
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_last_page_skips_count(self, task_service):
+        """测试第一页即最后一页时由结果推算总数，不执行 COUNT 查询"""
+        task_service.task_repo.get_user_tasks.return_value = []
+
+        result = await task_service.get_user_tasks(user_id=1)
+
+        assert result.total == 0
+        assert result.next_cursor is None
+        task_service.task_repo.count_user_tasks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_tasks_empty_later_page_counts(self, task_service):
+        """测试超出范围的页码仍通过 COUNT 查询获取总数"""
+        task_service.task_repo.get_user_tasks.return_value = []
+        task_service.task_repo.count_user_tasks.return_value = 5
+
+        result = await task_service.get_user_tasks(user_id=1, page=3, page_size=5)
+
+        assert result.total == 5
+        task_service.task_repo.count_user_tasks.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_task_statistics(self, task_service):
         """测试获取任务统计"""
         # Arrange
         task_service.task_repo.count_by_status.return_value = {
-            TaskStatus.PENDING: 5,
-            TaskStatus.IN_PROGRESS: 3,
-            TaskStatus.COMPLETED: 10,
+            "pending": 5,
+            "in_progress": 3,
+            "completed": 10,
         }
 
         # Act